@@ -0,0 +1,16 @@
+"""
+Instantly MCP Server - Request field helpers
+
+Collects the optional input fields a tool forwards as query params or body.
+"""
+
+from typing import Any
+
+
+def set_fields(params: Any, fields: tuple[str, ...]) -> dict[str, Any]:
+    """Collect the given fields, skipping unset and empty ("", [], {}) values."""
+    return {
+        field: value
+        for field in fields
+        if (value := getattr(params, field)) is not None and value not in ("", [], {})
+    }
@@ -0,0 +1,46 @@
+"""
+Instantly MCP Server - JSON helpers
+
+Uses orjson (C-accelerated) when installed, falling back to the stdlib.
+Install with: pip install "instantly-mcp[speedups]"
+
+Tool results are compact by default; set INSTANTLY_JSON_INDENT=1 to
+pretty-print them (2-space indent) when debugging.
+"""
+
+import json
+import os
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+PRETTY = os.environ.get("INSTANTLY_JSON_INDENT", "").strip().lower() in ("1", "true", "yes")
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if PRETTY else 0)
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def dumps(obj: Any) -> str:
+    """Serialize a tool result to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+    if PRETTY:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,18 @@
+"""
+Instantly MCP Server - URL helpers
+
+Percent-encoding for email addresses used as path segments.
+"""
+
+import re
+from urllib.parse import quote
+
+# Addresses made only of these characters need nothing encoded except "@"
+_PLAIN_EMAIL_RE = re.compile(r"[A-Za-z0-9._\-]+@[A-Za-z0-9.\-]+")
+
+
+def quote_email(email: str) -> str:
+    """Encode an email address as a single URL path segment."""
+    if _PLAIN_EMAIL_RE.fullmatch(email):
+        return email.replace("@", "%40")
+    return quote(email, safe="")
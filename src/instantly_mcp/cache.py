@@ -0,0 +1,206 @@
+"""
+Instantly MCP Server - Response Cache
+
+In-process TTL + LRU cache for idempotent API reads.
+
+Features:
+- Keys hash (API key, method, endpoint, sorted params) so tenants never share entries
+- Bodies stored as raw bytes and re-parsed on hit (callers may mutate results freely)
+- Per-endpoint TTL overrides (polled endpoints are never cached)
+- Honors Cache-Control max-age / no-store from API responses
+- Keeps ETags so expired entries can be revalidated with If-None-Match
+- Cache policy via INSTANTLY_CACHE_POLICY: enabled, read_only, disabled, replay
+- Hit / miss / revalidation counters (reported by get_server_info)
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Literal, Optional
+
+from . import _json
+
+CachePolicy = Literal["enabled", "read_only", "disabled", "replay"]
+
+DEFAULT_CACHE_TTL = 30.0  # seconds
+DEFAULT_CACHE_SIZE = 512  # entries
+
+# Endpoint prefix -> TTL override (seconds). 0 means every read hits the API
+# (at most as a conditional If-None-Match request).
+# Status endpoints are polled for progress, so they must always hit the API.
+# Analytics aggregates move slowly; warmup stats update about once a day.
+ENDPOINT_TTLS: dict[str, float] = {
+    "/email-verification": 0,
+    "/background-jobs": 0,
+    "/campaigns/analytics": 30,
+    "/accounts/warmup-analytics": 300,
+}
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def _env_policy() -> CachePolicy:
+    policy = os.environ.get("INSTANTLY_CACHE_POLICY", "enabled").strip().lower()
+    if policy not in ("enabled", "read_only", "disabled", "replay"):
+        return "enabled"
+    return policy  # type: ignore[return-value]
+
+
+def _env_ttl() -> float:
+    try:
+        return float(os.environ.get("INSTANTLY_CACHE_TTL", DEFAULT_CACHE_TTL))
+    except ValueError:
+        return DEFAULT_CACHE_TTL
+
+
+class ResponseCache:
+    """
+    TTL + LRU cache of raw response bodies.
+
+    Policies:
+    - enabled: serve fresh hits, store new responses
+    - read_only: serve fresh hits, never store
+    - disabled: bypass the cache entirely
+    - replay: serve any stored entry even if expired, store on miss
+    """
+
+    def __init__(
+        self,
+        policy: Optional[CachePolicy] = None,
+        ttl: Optional[float] = None,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.policy: CachePolicy = policy or _env_policy()
+        self.ttl = _env_ttl() if ttl is None else ttl
+        self.maxsize = maxsize
+        # key -> (expires_at, body, etag)
+        self._entries: OrderedDict[str, tuple[float, bytes, Optional[str]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        # Bumped by clear(); reads started before a write must not store results
+        self.generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Check if the cache participates in requests at all."""
+        return self.policy != "disabled"
+
+    @staticmethod
+    def make_key(
+        api_key: str,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+    ) -> str:
+        """Build a cache key scoped to the calling tenant."""
+        raw = json.dumps(
+            [api_key, method, endpoint, params or {}],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def ttl_for(self, endpoint: str, cache_control: Optional[str] = None) -> Optional[float]:
+        """
+        Determine TTL from endpoint overrides and Cache-Control header.
+
+        Returns None when the response must not be stored at all; a TTL of 0
+        stores it already-expired, so it is only reused via ETag revalidation.
+        """
+        if cache_control and "no-store" in cache_control.lower():
+            return None
+
+        for prefix, ttl in ENDPOINT_TTLS.items():
+            if endpoint.startswith(prefix):
+                return ttl
+
+        if cache_control:
+            directives = cache_control.lower()
+            if "no-cache" in directives:
+                return 0
+            match = _MAX_AGE_RE.search(directives)
+            if match:
+                return float(match.group(1))
+
+        return self.ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the parsed cached body, or None on miss/expiry."""
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, body, etag = entry
+        if expires_at <= time.monotonic() and self.policy != "replay":
+            # Entries with an ETag stay around to be revalidated cheaply
+            if etag is None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return _json.loads(body)
+
+    def etag_for(self, key: str) -> Optional[str]:
+        """Return the ETag of a stored (possibly expired) entry."""
+        entry = self._entries.get(key) if self.enabled else None
+        return entry[2] if entry is not None else None
+
+    def revalidate(self, key: str, ttl: Optional[float]) -> Optional[Any]:
+        """Refresh an entry after a 304 Not Modified and return its body."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        _, body, etag = entry
+        self.revalidations += 1
+        if ttl and self.policy not in ("read_only", "disabled"):
+            self._entries[key] = (time.monotonic() + ttl, body, etag)
+        self._entries.move_to_end(key)
+        return _json.loads(body)
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        ttl: Optional[float],
+        etag: Optional[str] = None,
+    ) -> None:
+        """Store a raw response body (and its ETag) for ttl seconds."""
+        if self.policy in ("read_only", "disabled") or ttl is None:
+            return
+        # Without an ETag an already-expired entry could never be reused
+        if ttl <= 0 and etag is None:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, body, etag)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, Any]:
+        """Summarize policy, size, and hit/miss counters."""
+        return {
+            "policy": self.policy,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+        }
+
+    def clear(self) -> None:
+        """Drop all cached entries (called after any write)."""
+        self._entries.clear()
+        self.generation += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,27 +4,54 @@ Instantly MCP Server - API Client
 HTTP client for making requests to the Instantly.ai API v2.
 Features:
 - Triple authentication (env variable + URL path + headers)
+- Persistent connection pool with HTTP/2 multiplexing
+- TTL response cache for idempotent GET requests
 - Rate limiting with header tracking
+- Automatic retry with backoff on 429 / transient 5xx responses
 - Dynamic timeouts based on operation type
 - Comprehensive error handling
 """
 
 import os
+import time
+import random
 import asyncio
-from typing import Any, Optional
+import weakref
+from typing import Any, Callable, Optional
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime
 
 import httpx
 
-# Import per-request API key context (lazy import to avoid circular deps)
+from . import _json
+from .cache import ResponseCache
+
+# Per-request API key getter, registered by http_app when it is imported
+# (avoids a circular import and any per-call import machinery)
+_request_api_key_getter: Optional[Callable[[], Optional[str]]] = None
+
+
+def register_request_api_key_getter(getter: Callable[[], Optional[str]]) -> None:
+    """Register the callable that returns the current request's API key."""
+    global _request_api_key_getter
+    _request_api_key_getter = getter
+
+
 def _get_request_api_key() -> Optional[str]:
     """Get API key from request context if available."""
-    try:
-        from .http_app import get_request_api_key
-        return get_request_api_key()
-    except ImportError:
-        return None
+    return _request_api_key_getter() if _request_api_key_getter else None
+
+
+@lru_cache(maxsize=1024)
+def _tenant_auth_header(api_key: str) -> dict[str, str]:
+    """
+    Auth header for a per-request (multi-tenant) key, built once per key.
+    
+    Shared between requests, so callers copy it before adding headers.
+    """
+    return {"Authorization": f"Bearer {api_key}"}
+
 
 # API Configuration
 INSTANTLY_API_URL = "https://api.instantly.ai/api/v2"
@@ -32,14 +59,55 @@ DEFAULT_TIMEOUT = 60.0  # seconds
 EXTENDED_TIMEOUT = 90.0  # for list operations
 SEARCH_TIMEOUT = 120.0  # for search operations
 
+# Exact endpoint -> timeout override. Only static paths need longer timeouts,
+# so a dict hit replaces per-request substring checks.
+ENDPOINT_TIMEOUTS: dict[str, float] = {
+    "/leads/list": EXTENDED_TIMEOUT,
+}
+
+# Retry configuration
+MAX_RETRIES = 3
+MAX_RETRY_DELAY = 60.0  # seconds
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+# Only these methods are retried after a 5xx/timeout (the request may have
+# been applied). 429s are retried for every method since they were rejected.
+IDEMPOTENT_METHODS = frozenset({"GET", "DELETE"})
+
+# Connection pool configuration (shared across all tool calls)
+POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
+)
+# Retries for failed connection attempts only. Nothing was sent, so these are
+# safe for every method (unlike the response-level retries above).
+CONNECT_RETRIES = 2
+
+# In-flight requests allowed per API key. Concurrent tool calls multiplex over
+# HTTP/2; the cap keeps a burst from tripping the tenant's rate limit.
+MAX_CONCURRENT_REQUESTS = 10
+
 
 @dataclass
 class RateLimitInfo:
-    """Track rate limit information from API responses."""
+    """
+    Track rate limit information from API responses.
+    
+    Timestamps are stored as epoch seconds (cheap to record on every
+    response) and converted to datetime only when read.
+    """
     remaining: Optional[int] = None
     limit: Optional[int] = None
-    reset_at: Optional[datetime] = None
-    last_updated: Optional[datetime] = None
+    reset_at: Optional[float] = None
+    last_updated: Optional[float] = None
+    
+    def reset_at_dt(self) -> Optional[datetime]:
+        """Rate limit reset time as a datetime."""
+        return datetime.fromtimestamp(self.reset_at) if self.reset_at is not None else None
+    
+    def last_updated_dt(self) -> Optional[datetime]:
+        """Last header update time as a datetime."""
+        return datetime.fromtimestamp(self.last_updated) if self.last_updated is not None else None
 
 
 @dataclass
@@ -54,20 +122,84 @@ class InstantlyClient:
     
     _api_key: Optional[str] = field(default=None, repr=False)
     rate_limit: RateLimitInfo = field(default_factory=RateLimitInfo)
+    cache: ResponseCache = field(default_factory=ResponseCache)
+    _http: Optional[httpx.AsyncClient] = field(default=None, init=False, repr=False)
+    _http_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+    # Prebuilt auth header for the configured key (treat as read-only)
+    _auth_header: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    # API key -> semaphore; entries vanish once a tenant has nothing in flight
+    _slots: weakref.WeakValueDictionary = field(
+        default_factory=weakref.WeakValueDictionary, init=False, repr=False
+    )
+    # Cache key -> event set when the in-flight read for that key finishes
+    _inflight: dict[str, asyncio.Event] = field(default_factory=dict, init=False, repr=False)
     
     def __post_init__(self):
         # Try to get API key from environment if not provided
         if not self._api_key:
             self._api_key = os.environ.get("INSTANTLY_API_KEY")
+        self._build_auth_header()
+    
+    def _build_auth_header(self) -> None:
+        """Rebuild the cached Authorization header for the configured key."""
+        self._auth_header = (
+            {"Authorization": f"Bearer {self._api_key}"} if self._api_key else {}
+        )
     
     @property
     def has_api_key(self) -> bool:
         """Check if an API key is configured."""
         return bool(self._api_key)
     
+    def resolve_api_key(self, api_key: Optional[str] = None) -> Optional[str]:
+        """Resolve the key a request would use (param > request context > instance)."""
+        return api_key or _get_request_api_key() or self._api_key
+    
     def set_api_key(self, api_key: str) -> None:
         """Set API key programmatically."""
         self._api_key = api_key
+        self._build_auth_header()
+    
+    async def _get_http(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+        
+        A single long-lived client keeps TCP/TLS connections alive between
+        tool calls and lets concurrent calls multiplex over HTTP/2.
+        """
+        if self._http is None or self._http.is_closed:
+            async with self._http_lock:
+                if self._http is None or self._http.is_closed:
+                    self._http = httpx.AsyncClient(
+                        base_url=INSTANTLY_API_URL,
+                        transport=httpx.AsyncHTTPTransport(
+                            http2=True,
+                            limits=POOL_LIMITS,
+                            retries=CONNECT_RETRIES,
+                        ),
+                        timeout=DEFAULT_TIMEOUT,
+                    )
+        return self._http
+    
+    def _slot(self, api_key: str) -> asyncio.Semaphore:
+        """Get the concurrency limiter for an API key."""
+        slot = self._slots.get(api_key)
+        if slot is None:
+            slot = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+            self._slots[api_key] = slot
+        return slot
+    
+    def _land(self, cache_key: Optional[str], flight: Optional[asyncio.Event]) -> None:
+        """Release readers waiting on an in-flight request."""
+        if flight is not None and self._inflight.get(cache_key) is flight:
+            del self._inflight[cache_key]
+            flight.set()
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and release pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
     
     def _get_timeout(self, endpoint: str, has_search: bool = False) -> float:
         """
@@ -78,23 +210,102 @@ class InstantlyClient:
         """
         if has_search:
             return SEARCH_TIMEOUT
-        if "/leads" in endpoint and "list" in endpoint:
-            return EXTENDED_TIMEOUT
-        return DEFAULT_TIMEOUT
+        return ENDPOINT_TIMEOUTS.get(endpoint, DEFAULT_TIMEOUT)
+    
+    def _retry_delay(self, response: Optional[httpx.Response], attempt: int) -> float:
+        """
+        Compute the delay before the next retry attempt.
+        
+        Prefers server guidance (Retry-After, then x-ratelimit-reset for 429s)
+        and falls back to exponential backoff with jitter.
+        """
+        delay = None
+        if response is not None:
+            retry_after = response.headers.get("retry-after")
+            if retry_after is not None:
+                try:
+                    delay = float(retry_after)
+                except ValueError:
+                    pass
+            if delay is None and response.status_code == 429 and self.rate_limit.reset_at:
+                delay = self.rate_limit.reset_at - time.time()
+        if delay is None or delay <= 0:
+            delay = 2 ** attempt + random.uniform(0, 0.5)
+        return min(delay, MAX_RETRY_DELAY)
+    
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str],
+        params: Optional[dict[str, Any]],
+        json: Optional[dict[str, Any]],
+        content: Optional[bytes] = None,
+        timeout: float,
+    ) -> httpx.Response:
+        """Send a request, retrying rate-limited and transient failures."""
+        http = await self._get_http()
+        retry_transient = method in IDEMPOTENT_METHODS
+        # Set once a failed attempt may still have been applied upstream
+        maybe_applied = False
+        
+        for attempt in range(MAX_RETRIES + 1):
+            can_retry = attempt < MAX_RETRIES
+            try:
+                response = await http.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    params=params,
+                    json=json,
+                    content=content,
+                    timeout=timeout,
+                )
+            except (httpx.TimeoutException, httpx.ConnectError) as e:
+                if not (can_retry and retry_transient):
+                    raise
+                # Connect failures never reached the API; read timeouts may have
+                if not isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout)):
+                    maybe_applied = True
+                await asyncio.sleep(self._retry_delay(None, attempt))
+                continue
+            
+            # Update rate limit tracking
+            self._update_rate_limit(response.headers)
+            
+            if (
+                can_retry
+                and response.status_code in RETRY_STATUS_CODES
+                and (response.status_code == 429 or retry_transient)
+            ):
+                if response.status_code != 429:
+                    maybe_applied = True
+                await asyncio.sleep(self._retry_delay(response, attempt))
+                continue
+            
+            if maybe_applied and method == "DELETE" and response.status_code == 404:
+                # An earlier attempt already deleted it, which is what was asked
+                return httpx.Response(204, request=response.request)
+            
+            return response
+        
+        raise AssertionError("unreachable")  # pragma: no cover
     
     def _update_rate_limit(self, headers: httpx.Headers) -> None:
         """Update rate limit tracking from response headers."""
         try:
-            if "x-ratelimit-remaining" in headers:
-                self.rate_limit.remaining = int(headers["x-ratelimit-remaining"])
-            if "x-ratelimit-limit" in headers:
-                self.rate_limit.limit = int(headers["x-ratelimit-limit"])
-            if "x-ratelimit-reset" in headers:
-                self.rate_limit.reset_at = datetime.fromtimestamp(
-                    int(headers["x-ratelimit-reset"])
-                )
-            self.rate_limit.last_updated = datetime.now()
-        except (ValueError, KeyError):
+            remaining = headers.get("x-ratelimit-remaining")
+            if remaining is not None:
+                self.rate_limit.remaining = int(remaining)
+            limit = headers.get("x-ratelimit-limit")
+            if limit is not None:
+                self.rate_limit.limit = int(limit)
+            reset = headers.get("x-ratelimit-reset")
+            if reset is not None:
+                self.rate_limit.reset_at = float(int(reset))
+            self.rate_limit.last_updated = time.time()
+        except ValueError:
             pass  # Silently ignore parsing errors
     
     async def request(
@@ -104,8 +315,10 @@ class InstantlyClient:
         *,
         params: Optional[dict[str, Any]] = None,
         json: Optional[dict[str, Any]] = None,
+        content: Optional[bytes] = None,
         api_key: Optional[str] = None,
         timeout: Optional[float] = None,
+        read_only: bool = False,
     ) -> Any:
         """
         Make an authenticated request to the Instantly API.
@@ -115,8 +328,16 @@ class InstantlyClient:
             endpoint: API endpoint path (e.g., '/accounts', '/campaigns/{id}')
             params: Query parameters for GET requests
             json: JSON body for POST/PATCH requests
+            content: Pre-serialized JSON body (e.g. InputModel.to_api_json())
             api_key: Optional per-request API key (overrides configured key)
             timeout: Optional custom timeout
+            read_only: Treat a POST as a read (cached by JSON body, never
+                clears the cache), for endpoints that only accept POST
+        
+        GET responses are served from the response cache when fresh and
+        revalidated with If-None-Match when expired but carrying an ETag;
+        any successful write clears it so reads never go stale. Concurrent
+        identical reads share one upstream request.
         
         Returns:
             Parsed JSON response
@@ -126,7 +347,7 @@ class InstantlyClient:
             httpx.HTTPStatusError: For API errors
         """
         # Resolve API key (per-request param > request context > instance > environment)
-        use_api_key = api_key or _get_request_api_key() or self._api_key
+        use_api_key = self.resolve_api_key(api_key)
         if not use_api_key:
             raise ValueError(
                 "Instantly API key is required. Provide via:\n"
@@ -136,56 +357,116 @@ class InstantlyClient:
                 "  - Environment: INSTANTLY_API_KEY"
             )
         
-        # Build request
-        url = f"{INSTANTLY_API_URL}{endpoint}"
-        headers = {"Authorization": f"Bearer {use_api_key}"}
+        # Build request (endpoint is joined onto the client's base_url)
+        if use_api_key == self._api_key:
+            headers = self._auth_header
+        else:
+            headers = _tenant_auth_header(use_api_key)
+        if content is not None:
+            headers = {**headers, "Content-Type": "application/json"}
         
         # Determine timeout
         has_search = bool(json and json.get("search"))
         request_timeout = timeout or self._get_timeout(endpoint, has_search)
         
-        async with httpx.AsyncClient(timeout=request_timeout) as client:
-            try:
-                response = await client.request(
-                    method=method,
-                    url=url,
+        # Serve idempotent reads from cache
+        cache_key = None
+        flight = None
+        is_read = method == "GET" or read_only
+        if is_read and self.cache.enabled:
+            cache_key = self.cache.make_key(
+                use_api_key, method, endpoint, params if method == "GET" else json
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+            waiter = self._inflight.get(cache_key)
+            if waiter is not None:
+                # Same read already in flight: wait and reuse its cached body
+                await waiter.wait()
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+            elif self.cache.ttl_for(endpoint):
+                # Polled (zero-TTL) endpoints are never shared
+                flight = self._inflight[cache_key] = asyncio.Event()
+            etag = self.cache.etag_for(cache_key)
+            if etag:
+                headers = {**headers, "If-None-Match": etag}
+        generation = self.cache.generation
+        
+        try:
+            async with self._slot(use_api_key):
+                response = await self._send(
+                    method,
+                    endpoint,
                     headers=headers,
                     params=params,
                     json=json,
+                    content=content,
+                    timeout=request_timeout,
                 )
-                
-                # Update rate limit tracking
-                self._update_rate_limit(response.headers)
-                
-                # Handle errors
-                if response.status_code >= 400:
-                    error_detail = self._parse_error(response)
-                    raise httpx.HTTPStatusError(
-                        message=error_detail,
-                        request=response.request,
-                        response=response,
+            
+            # Handle errors
+            if response.status_code >= 400:
+                error_detail = self._parse_error(response)
+                raise httpx.HTTPStatusError(
+                    message=error_detail,
+                    request=response.request,
+                    response=response,
+                )
+            
+            # Keep cached reads consistent with writes
+            if not is_read:
+                self.cache.clear()
+            
+            # Return parsed response
+            if response.status_code == 204:
+                return {"success": True}
+            
+            if cache_key is not None:
+                # A write that landed while this read was in flight cleared the
+                # cache; this response may predate it, so don't store it
+                fresh = self.cache.generation == generation
+                ttl = self.cache.ttl_for(endpoint, response.headers.get("cache-control"))
+                if response.status_code == 304:
+                    cached = self.cache.revalidate(cache_key, ttl) if fresh else None
+                    if cached is not None:
+                        return cached
+                    # Entry was evicted or invalidated mid-flight; fetch the full body
+                    self._land(cache_key, flight)
+                    return await self.request(
+                        method, endpoint, params=params, json=json, content=content,
+                        api_key=use_api_key, timeout=timeout, read_only=read_only,
                     )
-                
-                # Return parsed response
-                if response.status_code == 204:
-                    return {"success": True}
-                
-                return response.json()
-                
-            except httpx.TimeoutException as e:
-                raise TimeoutError(
-                    f"Request timed out after {request_timeout}s. "
-                    f"For large datasets, try using pagination with smaller limits."
-                ) from e
-            except httpx.RequestError as e:
-                raise ConnectionError(
-                    f"Failed to connect to Instantly API: {e}"
-                ) from e
+                if fresh:
+                    self.cache.put(
+                        cache_key, response.content, ttl, response.headers.get("etag")
+                    )
+            
+            return _json.loads(response.content)
+            
+        except httpx.TimeoutException as e:
+            raise TimeoutError(
+                f"Request timed out after {request_timeout}s. "
+                f"For large datasets, try using pagination with smaller limits."
+            ) from e
+        except httpx.RequestError as e:
+            raise ConnectionError(
+                f"Failed to connect to Instantly API: {e}"
+            ) from e
+        finally:
+            self._land(cache_key, flight)
     
     def _parse_error(self, response: httpx.Response) -> str:
         """Parse error response and return descriptive message."""
-        try:
-            data = response.json()
+        # Gateway errors (502/504) are usually HTML or plain text; only
+        # attempt a JSON parse when the server says the body is JSON.
+        if "json" in response.headers.get("content-type", ""):
+            try:
+                data = _json.loads(response.content)
+            except ValueError:
+                data = None
             
             # Handle various error formats from Instantly API
             if isinstance(data, dict):
@@ -203,11 +484,8 @@ class InstantlyClient:
                 # Detail format
                 if "detail" in data:
                     return data["detail"]
-            
-            return f"HTTP {response.status_code}: {response.text[:200]}"
-            
-        except Exception:
-            return f"HTTP {response.status_code}: {response.text[:200]}"
+        
+        return f"HTTP {response.status_code}: {response.text[:200]}"
     
     # Convenience methods
     async def get(self, endpoint: str, **kwargs) -> Any:
@@ -226,6 +504,26 @@ class InstantlyClient:
         """DELETE request."""
         return await self.request("DELETE", endpoint, **kwargs)
 
+    async def gather(
+        self,
+        *specs: tuple[str, str, Optional[dict[str, Any]]],
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """
+        Issue independent requests concurrently.
+
+        Each spec is (method, endpoint, params). Requests multiplex over the
+        shared HTTP/2 connection; at most MAX_CONCURRENT_REQUESTS per API key
+        are in flight at once. Results are returned in spec order.
+        """
+        return await asyncio.gather(
+            *(
+                self.request(method, endpoint, params=params)
+                for method, endpoint, params in specs
+            ),
+            return_exceptions=return_exceptions,
+        )
+
 
 # Global client instance
 client = InstantlyClient()
@@ -9,20 +9,65 @@ Provides an ASGI wrapper for FastMCP that supports:
 Matches the authentication patterns from the TypeScript version.
 """
 
-import json
-import re
 from contextvars import ContextVar
 from typing import Optional, Callable, Any
 
+from . import _json
+from .client import get_client, register_request_api_key_getter
+
+# /mcp/{api_key}[/suffix] paths are split with plain string ops (no regex)
+_MCP_PREFIX = "/mcp/"
+
+# Known MCP subpaths that must never be treated as API keys
+_MCP_RESERVED_SEGMENTS = frozenset({"sse", "messages"})
+
 # Context variable to store per-request API key
 request_api_key: ContextVar[Optional[str]] = ContextVar("request_api_key", default=None)
 
 
+def _json_response_headers(body: bytes) -> list[tuple[bytes, bytes]]:
+    """Build static JSON response headers for a precomputed body."""
+    return [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+
+
+# Static response bodies, serialized once at import time
+_HEALTH_BODY = _json.dumps_bytes({
+    "status": "healthy",
+    "server": "instantly-mcp",
+    "version": "1.0.0",
+    "endpoints": {
+        "mcp": "/mcp",
+        "mcp_with_key": "/mcp/{api_key}",
+    },
+    "authentication": {
+        "methods": [
+            "URL path: /mcp/YOUR_API_KEY",
+            "Header: Authorization: YOUR_API_KEY",
+            "Header: x-instantly-api-key: YOUR_API_KEY",
+        ],
+        "note": "Bearer prefix is optional for Authorization header"
+    }
+})
+_HEALTH_HEADERS = _json_response_headers(_HEALTH_BODY)
+
+_NOT_FOUND_BODY = _json.dumps_bytes({
+    "error": "Not found",
+    "hint": "MCP endpoint is at /mcp or /mcp/{api_key}"
+})
+_NOT_FOUND_HEADERS = _json_response_headers(_NOT_FOUND_BODY)
+
+
 def get_request_api_key() -> Optional[str]:
     """Get the API key for the current request from context."""
     return request_api_key.get()
 
 
+register_request_api_key_getter(get_request_api_key)
+
+
 def extract_api_key_from_headers(headers: list) -> Optional[str]:
     """
     Extract API key from request headers.
@@ -32,20 +77,26 @@ def extract_api_key_from_headers(headers: list) -> Optional[str]:
     2. Authorization: KEY (without Bearer)
     3. Authorization: Bearer KEY
     """
-    headers_dict = {k.decode().lower(): v.decode() for k, v in headers}
+    # Single pass over raw ASGI headers; only matched values are decoded
+    custom_header = auth_header = None
+    for name, value in headers:
+        name = name.lower()
+        if name == b"x-instantly-api-key":
+            custom_header = value
+        elif name == b"authorization":
+            auth_header = value
     
     # Check custom header first
-    api_key = headers_dict.get("x-instantly-api-key")
-    if api_key:
-        return api_key
+    if custom_header:
+        return custom_header.decode()
     
     # Check Authorization header
-    auth_header = headers_dict.get("authorization", "")
     if auth_header:
+        auth_value = auth_header.decode()
         # Support both "Bearer KEY" and plain "KEY" formats
-        if auth_header.lower().startswith("bearer "):
-            return auth_header[7:]
-        return auth_header
+        if auth_value[:7].lower() == "bearer ":
+            return auth_value[7:]
+        return auth_value
     
     return None
 
@@ -67,18 +118,17 @@ def create_api_key_middleware(app: Callable) -> Callable:
         api_key = None
         path = scope.get("path", "")
         
-        # Match /mcp/{api_key} pattern
+        # Match /mcp/{api_key}[/suffix]
         # Don't match known MCP subpaths: sse, messages
-        match = re.match(r"^/mcp/([^/]+)(/.*)?$", path)
-        if match:
-            potential_key = match.group(1)
+        if path.startswith(_MCP_PREFIX):
+            potential_key, sep, rest = path[len(_MCP_PREFIX):].partition("/")
             # Don't treat known MCP subpaths as API keys
-            if potential_key not in ("sse", "messages"):
+            if potential_key and potential_key not in _MCP_RESERVED_SEGMENTS:
                 api_key = potential_key
-                # Rewrite path to remove the API key segment
-                suffix = match.group(2) or ""
-                scope = dict(scope)  # Make a copy
-                scope["path"] = "/mcp" + suffix
+                # Rewrite path in place to remove the API key segment.
+                # No copy: this scope is owned by the server for this request,
+                # and the rewrite also keeps the key out of access logs.
+                scope["path"] = "/mcp" + sep + rest
         
         # Fall back to headers if no URL key
         if not api_key:
@@ -103,40 +153,36 @@ def create_health_handler() -> Callable:
         if scope["type"] != "http":
             return
         
-        response_body = json.dumps({
-            "status": "healthy",
-            "server": "instantly-mcp",
-            "version": "1.0.0",
-            "endpoints": {
-                "mcp": "/mcp",
-                "mcp_with_key": "/mcp/{api_key}",
-            },
-            "authentication": {
-                "methods": [
-                    "URL path: /mcp/YOUR_API_KEY",
-                    "Header: Authorization: YOUR_API_KEY",
-                    "Header: x-instantly-api-key: YOUR_API_KEY",
-                ],
-                "note": "Bearer prefix is optional for Authorization header"
-            }
-        }).encode()
-        
         await send({
             "type": "http.response.start",
             "status": 200,
-            "headers": [
-                (b"content-type", b"application/json"),
-                (b"content-length", str(len(response_body)).encode()),
-            ],
+            "headers": _HEALTH_HEADERS,
         })
         await send({
             "type": "http.response.body",
-            "body": response_body,
+            "body": _HEALTH_BODY,
         })
     
     return health_app
 
 
+def _close_client_on_shutdown(send: Callable) -> Callable:
+    """
+    Wrap an ASGI lifespan send so the shared API client closes at shutdown.
+    
+    The ASGI lifespan runs once per process. Some FastMCP releases run their
+    own lifespan per session, so closing the pooled client there could cut
+    off other sessions' in-flight requests.
+    """
+    
+    async def wrapped(message: dict) -> None:
+        if message["type"] == "lifespan.shutdown.complete":
+            await get_client().aclose()
+        await send(message)
+    
+    return wrapped
+
+
 def create_http_app(mcp_app) -> Callable:
     """
     Create an ASGI app that wraps FastMCP with URL-based auth support.
@@ -152,6 +198,9 @@ def create_http_app(mcp_app) -> Callable:
     health_app = create_health_handler()
     
     async def router(scope: dict, receive: Callable, send: Callable):
+        if scope["type"] == "lifespan":
+            await fastmcp_asgi(scope, receive, _close_client_on_shutdown(send))
+            return
         if scope["type"] not in ("http", "websocket"):
             await fastmcp_asgi(scope, receive, send)
             return
@@ -169,22 +218,14 @@ def create_http_app(mcp_app) -> Callable:
             return
         
         # 404 for unknown paths
-        response_body = json.dumps({
-            "error": "Not found",
-            "hint": "MCP endpoint is at /mcp or /mcp/{api_key}"
-        }).encode()
-        
         await send({
             "type": "http.response.start",
             "status": 404,
-            "headers": [
-                (b"content-type", b"application/json"),
-                (b"content-length", str(len(response_body)).encode()),
-            ],
+            "headers": _NOT_FOUND_HEADERS,
         })
         await send({
             "type": "http.response.body",
-            "body": response_body,
+            "body": _NOT_FOUND_BODY,
         })
     
     # Wrap router with API key middleware
@@ -192,8 +233,22 @@ def create_http_app(mcp_app) -> Callable:
 
 
 def run_http_server(mcp_app, host: str = "0.0.0.0", port: int = 8000):
-    """Run the HTTP server with URL-based auth support."""
+    """
+    Run the HTTP server with URL-based auth support.
+    
+    Uses uvloop and the httptools C parser when installed
+    (pip install "instantly-mcp[speedups]"), else asyncio and h11.
+    """
+    from importlib.util import find_spec
     import uvicorn
     
     app = create_http_app(mcp_app)
-    uvicorn.run(app, host=host, port=port)
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "h11",
+        log_level="warning",
+        access_log=False,
+    )
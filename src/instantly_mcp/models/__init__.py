@@ -5,50 +5,70 @@ Input validation models for all API operations.
 Using Pydantic v2 for automatic validation and OpenAPI schema generation.
 """
 
-from .common import PaginationParams, PaginationResponse
-from .accounts import (
-    ListAccountsInput,
-    GetAccountInput,
-    CreateAccountInput,
-    UpdateAccountInput,
-    ManageAccountStateInput,
-    DeleteAccountInput,
-)
-from .campaigns import (
-    CreateCampaignInput,
-    ListCampaignsInput,
-    GetCampaignInput,
-    UpdateCampaignInput,
-    ActivateCampaignInput,
-    PauseCampaignInput,
-)
-from .leads import (
-    ListLeadsInput,
-    GetLeadInput,
-    CreateLeadInput,
-    UpdateLeadInput,
-    ListLeadListsInput,
-    CreateLeadListInput,
-    UpdateLeadListInput,
-    GetVerificationStatsInput,
-    BulkAddLeadsInput,
-    DeleteLeadInput,
-    MoveLeadsInput,
-)
-from .emails import (
-    ListEmailsInput,
-    GetEmailInput,
-    ReplyToEmailInput,
-    VerifyEmailInput,
-)
-from .analytics import (
-    GetCampaignAnalyticsInput,
-    GetDailyCampaignAnalyticsInput,
-    GetWarmupAnalyticsInput,
-)
+from importlib import import_module
+from typing import Any
+
+from .common import InputModel, PaginationParams, PaginationResponse
+# Category models are imported on first attribute access so that a server
+# started with TOOL_CATEGORIES only builds validators for the categories it
+# loads (tool modules import their own models submodule directly).
+_LAZY_EXPORTS: dict[str, str] = {
+    # Accounts
+    "ListAccountsInput": "accounts",
+    "GetAccountInput": "accounts",
+    "CreateAccountInput": "accounts",
+    "UpdateAccountInput": "accounts",
+    "ManageAccountStateInput": "accounts",
+    "DeleteAccountInput": "accounts",
+    # Campaigns
+    "CreateCampaignInput": "campaigns",
+    "ListCampaignsInput": "campaigns",
+    "GetCampaignInput": "campaigns",
+    "UpdateCampaignInput": "campaigns",
+    "ActivateCampaignInput": "campaigns",
+    "PauseCampaignInput": "campaigns",
+    # Leads
+    "ListLeadsInput": "leads",
+    "GetLeadInput": "leads",
+    "GetLeadsBulkInput": "leads",
+    "CreateLeadInput": "leads",
+    "UpdateLeadInput": "leads",
+    "ListLeadListsInput": "leads",
+    "CreateLeadListInput": "leads",
+    "UpdateLeadListInput": "leads",
+    "GetVerificationStatsInput": "leads",
+    "BulkAddLeadsInput": "leads",
+    "DeleteLeadInput": "leads",
+    "MoveLeadsInput": "leads",
+    # Emails
+    "ListEmailsInput": "emails",
+    "GetEmailInput": "emails",
+    "GetEmailsBulkInput": "emails",
+    "ReplyToEmailInput": "emails",
+    "VerifyEmailInput": "emails",
+    # Analytics
+    "GetCampaignAnalyticsInput": "analytics",
+    "GetDailyCampaignAnalyticsInput": "analytics",
+    "GetWarmupAnalyticsInput": "analytics",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Common
+    "InputModel",
     "PaginationParams",
     "PaginationResponse",
     # Accounts
@@ -68,6 +88,7 @@ __all__ = [
     # Leads
     "ListLeadsInput",
     "GetLeadInput",
+    "GetLeadsBulkInput",
     "CreateLeadInput",
     "UpdateLeadInput",
     "ListLeadListsInput",
@@ -80,6 +101,7 @@ __all__ = [
     # Emails
     "ListEmailsInput",
     "GetEmailInput",
+    "GetEmailsBulkInput",
     "ReplyToEmailInput",
     "VerifyEmailInput",
     # Analytics
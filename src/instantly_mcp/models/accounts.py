@@ -3,42 +3,41 @@ Pydantic models for Account operations.
 """
 
 from typing import Any, Literal, Optional
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
+from pydantic import Field
 
+from .common import VERBATIM_CONFIG, EmailAddress, InputModel, PageLimit, Percent
 
-class WarmupAdvancedSettings(BaseModel):
+
+class WarmupAdvancedSettings(InputModel):
     """Advanced warmup configuration."""
     
-    model_config = ConfigDict(extra="ignore")
+    model_config = VERBATIM_CONFIG
     
     warm_ctd: Optional[bool] = Field(default=None, description="Warm CTD enabled")
-    open_rate: Optional[int] = Field(default=None, ge=0, le=100, description="Target open rate %")
-    important_rate: Optional[int] = Field(default=None, ge=0, le=100, description="Important rate %")
+    open_rate: Optional[Percent] = Field(default=None, description="Target open rate %")
+    important_rate: Optional[Percent] = Field(default=None, description="Important rate %")
     read_emulation: Optional[bool] = Field(default=None, description="Read emulation enabled")
-    spam_save_rate: Optional[int] = Field(default=None, ge=0, le=100, description="Spam save rate %")
+    spam_save_rate: Optional[Percent] = Field(default=None, description="Spam save rate %")
     weekday_only: Optional[bool] = Field(default=None, description="Weekday only warmup")
 
 
-class WarmupSettings(BaseModel):
+class WarmupSettings(InputModel):
     """Warmup configuration settings."""
     
-    model_config = ConfigDict(extra="ignore")
+    model_config = VERBATIM_CONFIG
     
     limit: Optional[int] = Field(default=None, ge=1, description="Daily warmup email limit")
     advanced: Optional[WarmupAdvancedSettings] = Field(default=None, description="Advanced settings")
     warmup_custom_ftag: Optional[str] = Field(default=None, description="Custom from tag")
     increment: Optional[str] = Field(default=None, description="Daily increment value")
-    reply_rate: Optional[int] = Field(default=None, ge=0, le=100, description="Reply rate %")
+    reply_rate: Optional[Percent] = Field(default=None, description="Reply rate %")
 
 
-class ListAccountsInput(BaseModel):
+class ListAccountsInput(InputModel):
     """Input for listing email accounts."""
     
-    # Use extra="ignore" to be tolerant of unexpected fields from LLMs
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    limit: Optional[int] = Field(
-        default=100, ge=1, le=100,
+    limit: Optional[PageLimit] = Field(
+        default=100,
         description="Results per page (1-100, default: 100)"
     )
     starting_after: Optional[str] = Field(
@@ -63,20 +62,16 @@ class ListAccountsInput(BaseModel):
     )
 
 
-class GetAccountInput(BaseModel):
+class GetAccountInput(InputModel):
     """Input for getting account details."""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    email: str = Field(..., description="Account email address")
+    email: EmailAddress = Field(..., description="Account email address")
 
 
-class CreateAccountInput(BaseModel):
+class CreateAccountInput(InputModel):
     """Input for creating an email account with IMAP/SMTP credentials."""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    email: str = Field(..., description="Email address")
+    email: EmailAddress = Field(..., description="Email address")
     first_name: str = Field(..., description="First name")
     last_name: str = Field(..., description="Last name")
     provider_code: Literal[1, 2, 3, 4] = Field(
@@ -92,12 +87,10 @@ class CreateAccountInput(BaseModel):
     smtp_port: int = Field(..., description="SMTP port (e.g., 587)")
 
 
-class UpdateAccountInput(BaseModel):
+class UpdateAccountInput(InputModel):
     """Input for updating account settings (partial update)."""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    email: str = Field(..., description="Account to update")
+    email: EmailAddress = Field(..., description="Account to update")
     first_name: Optional[str] = Field(default=None)
     last_name: Optional[str] = Field(default=None)
     warmup: Optional[WarmupSettings] = Field(default=None, description="Warmup configuration")
@@ -114,21 +107,17 @@ class UpdateAccountInput(BaseModel):
     inbox_placement_test_limit: Optional[int] = Field(default=None)
 
 
-class ManageAccountStateInput(BaseModel):
+class ManageAccountStateInput(InputModel):
     """Input for managing account state (pause, resume, warmup control, vitals test)."""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    email: str = Field(..., description="Account email")
+    email: EmailAddress = Field(..., description="Account email")
     action: Literal["pause", "resume", "enable_warmup", "disable_warmup", "test_vitals"] = Field(
         ..., description="Action to perform"
     )
 
 
-class DeleteAccountInput(BaseModel):
+class DeleteAccountInput(InputModel):
     """Input for deleting an account. ⚠️ PERMANENT - CANNOT UNDO!"""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    email: str = Field(..., description="Email to DELETE PERMANENTLY")
+    email: EmailAddress = Field(..., description="Email to DELETE PERMANENTLY")
 
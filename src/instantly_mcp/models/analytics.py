@@ -3,18 +3,18 @@ Pydantic models for Analytics operations.
 """
 
 from typing import Literal, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import Field
 
+from .common import InputModel
 
-class GetCampaignAnalyticsInput(BaseModel):
+
+class GetCampaignAnalyticsInput(InputModel):
     """
     Input for getting campaign analytics.
     
     Metrics: opens, clicks, replies, bounces. Filter by campaign(s) and dates.
     """
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
     campaign_id: Optional[str] = Field(
         default=None,
         description="Single campaign UUID (omit for all)"
@@ -31,11 +31,9 @@ class GetCampaignAnalyticsInput(BaseModel):
     )
 
 
-class GetDailyCampaignAnalyticsInput(BaseModel):
+class GetDailyCampaignAnalyticsInput(InputModel):
     """Input for getting day-by-day campaign performance analytics."""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
     campaign_id: Optional[str] = Field(
         default=None,
         description="Campaign UUID (omit for all)"
@@ -48,11 +46,9 @@ class GetDailyCampaignAnalyticsInput(BaseModel):
     )
 
 
-class GetWarmupAnalyticsInput(BaseModel):
+class GetWarmupAnalyticsInput(InputModel):
     """Input for getting warmup metrics for account(s)."""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
     emails: Optional[list[str]] = Field(default=None, description="Account emails")
     email: Optional[str] = Field(default=None, description="Single email (alternative)")
     start_date: Optional[str] = Field(default=None, description="YYYY-MM-DD")
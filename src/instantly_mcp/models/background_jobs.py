@@ -3,16 +3,16 @@ Pydantic models for Background Job operations.
 """
 
 from typing import Optional
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import Field
 
+from .common import InputModel, PageLimit
 
-class ListBackgroundJobsInput(BaseModel):
+
+class ListBackgroundJobsInput(InputModel):
     """Input for listing background jobs with pagination."""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    limit: Optional[int] = Field(
-        default=100, ge=1, le=100,
+    limit: Optional[PageLimit] = Field(
+        default=100,
         description="Results per page (1-100, default: 100)"
     )
     starting_after: Optional[str] = Field(
@@ -21,10 +21,8 @@ class ListBackgroundJobsInput(BaseModel):
     )
 
 
-class GetBackgroundJobInput(BaseModel):
+class GetBackgroundJobInput(InputModel):
     """Input for getting a specific background job."""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
     job_id: str = Field(..., description="Background job UUID")
 
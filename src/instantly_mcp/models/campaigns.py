@@ -3,13 +3,23 @@ Pydantic models for Campaign operations.
 """
 
 from typing import Any, Literal, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import Field
+
+from .common import (
+    DEFERRED_CONFIG,
+    CampaignDailyLimit,
+    EmailBodyText,
+    EmailGapMinutes,
+    InputModel,
+    PageLimit,
+    UUIDStr,
+)
 
 # Default timezone for business operations
 # NOTE: Instantly.ai officially recommends America/Chicago as default
 # America/New_York is mapped to America/Detroit in Instantly.ai's verified timezone list
 DEFAULT_TIMEZONE = "America/Chicago"
-BUSINESS_PRIORITY_TIMEZONES = [
+BUSINESS_PRIORITY_TIMEZONES: tuple[str, ...] = (
     "America/Chicago",      # Central Time (US) - RECOMMENDED DEFAULT
     "America/Detroit",      # Eastern Time (US) - maps from America/New_York
     "America/Boise",        # Mountain Time (US) - maps from America/Denver
@@ -18,10 +28,13 @@ BUSINESS_PRIORITY_TIMEZONES = [
     "Asia/Dubai",           # Gulf Standard Time
     "Asia/Hong_Kong",       # Hong Kong Time
     "Australia/Melbourne",  # Australian Eastern Time
-]
+)
 
+# Built once at import; referenced by the timezone Field below
+TIMEZONE_DESCRIPTION = f"Supported: {', '.join(BUSINESS_PRIORITY_TIMEZONES[:5])}..."
 
-class CreateCampaignInput(BaseModel):
+
+class CreateCampaignInput(InputModel):
     """
     Input for creating an email campaign.
     
@@ -32,14 +45,14 @@ class CreateCampaignInput(BaseModel):
     Use sequence_steps for multi-step email sequences.
     """
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+    model_config = DEFERRED_CONFIG
     
     name: str = Field(..., description="Campaign name")
     subject: str = Field(
         ..., max_length=100,
         description="Subject (<50 chars recommended). Personalization: {{firstName}}, {{companyName}}"
     )
-    body: str = Field(
+    body: EmailBodyText = Field(
         ...,
         description="Email body (\\n for line breaks). Personalization: {{firstName}}, {{lastName}}, {{companyName}}"
     )
@@ -51,16 +64,16 @@ class CreateCampaignInput(BaseModel):
     track_clicks: Optional[bool] = Field(default=False)
     timezone: Optional[str] = Field(
         default=DEFAULT_TIMEZONE,
-        description=f"Supported: {', '.join(BUSINESS_PRIORITY_TIMEZONES[:5])}..."
+        description=TIMEZONE_DESCRIPTION
     )
     timing_from: Optional[str] = Field(default="09:00", description="24h format start time")
     timing_to: Optional[str] = Field(default="17:00", description="24h format end time")
-    daily_limit: Optional[int] = Field(
-        default=30, ge=1, le=50,
+    daily_limit: Optional[CampaignDailyLimit] = Field(
+        default=30,
         description="Emails/day/account (max 50)"
     )
-    email_gap: Optional[int] = Field(
-        default=10, ge=1, le=1440,
+    email_gap: Optional[EmailGapMinutes] = Field(
+        default=10,
         description="Minutes between emails (1-1440)"
     )
     stop_on_reply: Optional[bool] = Field(default=True)
@@ -77,20 +90,17 @@ class CreateCampaignInput(BaseModel):
         default=None,
         description="Custom subjects per step"
     )
-    sequence_bodies: Optional[list[str]] = Field(
+    sequence_bodies: Optional[list[EmailBodyText]] = Field(
         default=None,
         description="Custom bodies per step"
     )
 
 
-class ListCampaignsInput(BaseModel):
+class ListCampaignsInput(InputModel):
     """Input for listing campaigns with pagination."""
     
-    # Use extra="ignore" to be tolerant of unexpected fields from LLMs
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    limit: Optional[int] = Field(
-        default=100, ge=1, le=100,
+    limit: Optional[PageLimit] = Field(
+        default=100,
         description="Results per page (1-100, default: 100)"
     )
     starting_after: Optional[str] = Field(
@@ -107,24 +117,22 @@ class ListCampaignsInput(BaseModel):
     )
 
 
-class GetCampaignInput(BaseModel):
+class GetCampaignInput(InputModel):
     """Input for getting campaign details."""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    campaign_id: str = Field(..., description="Campaign UUID")
+    campaign_id: UUIDStr = Field(..., description="Campaign UUID")
 
 
-class UpdateCampaignInput(BaseModel):
+class UpdateCampaignInput(InputModel):
     """
     Input for updating campaign settings (partial update).
     
     Common updates: name, sequences, tracking, limits, email_list.
     """
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+    model_config = DEFERRED_CONFIG
     
-    campaign_id: str = Field(..., description="Campaign to update")
+    campaign_id: UUIDStr = Field(..., description="Campaign to update")
     name: Optional[str] = Field(default=None)
     pl_value: Optional[float] = Field(default=None, description="Pipeline value")
     is_evergreen: Optional[bool] = Field(default=None)
@@ -136,11 +144,11 @@ class UpdateCampaignInput(BaseModel):
         default=None,
         description="Email sequence steps"
     )
-    email_gap: Optional[int] = Field(default=None, ge=1, le=1440)
+    email_gap: Optional[EmailGapMinutes] = Field(default=None)
     random_wait_max: Optional[int] = Field(default=None)
     text_only: Optional[bool] = Field(default=None)
     email_list: Optional[list[str]] = Field(default=None, description="Sender accounts")
-    daily_limit: Optional[int] = Field(default=None, ge=1, le=50)
+    daily_limit: Optional[CampaignDailyLimit] = Field(default=None)
     stop_on_reply: Optional[bool] = Field(default=None)
     email_tag_list: Optional[list[str]] = Field(default=None)
     link_tracking: Optional[bool] = Field(default=None)
@@ -158,50 +166,42 @@ class UpdateCampaignInput(BaseModel):
     bcc_list: Optional[list[str]] = Field(default=None)
 
 
-class ActivateCampaignInput(BaseModel):
+class ActivateCampaignInput(InputModel):
     """
     Input for activating a campaign.
     
     Prerequisites: accounts, leads, sequences, schedule must be configured.
     """
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    campaign_id: str = Field(..., description="Campaign UUID to activate")
+    campaign_id: UUIDStr = Field(..., description="Campaign UUID to activate")
 
 
-class PauseCampaignInput(BaseModel):
+class PauseCampaignInput(InputModel):
     """
     Input for pausing a campaign.
 
     Stops sending but leads remain. Use activate_campaign to resume.
     """
 
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+    campaign_id: UUIDStr = Field(..., description="Active campaign UUID")
 
-    campaign_id: str = Field(..., description="Active campaign UUID")
 
-
-class DeleteCampaignInput(BaseModel):
+class DeleteCampaignInput(InputModel):
     """
     Input for deleting a campaign. ⚠️ PERMANENT - CANNOT UNDO!
 
     Requires user confirmation before executing.
     """
 
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-
-    campaign_id: str = Field(..., description="Campaign UUID to DELETE PERMANENTLY")
+    campaign_id: UUIDStr = Field(..., description="Campaign UUID to DELETE PERMANENTLY")
 
 
-class SearchCampaignsByContactInput(BaseModel):
+class SearchCampaignsByContactInput(InputModel):
     """
     Input for searching campaigns by contact email.
 
     Finds all campaigns a specific lead/contact is enrolled in.
     """
 
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-
     contact_email: str = Field(..., description="Email address of the contact to search for")
 
@@ -2,22 +2,98 @@
 Common Pydantic models for pagination and shared types.
 """
 
-from typing import Any, Optional
-from pydantic import BaseModel, Field, ConfigDict
+import re
+from functools import lru_cache
+from typing import Annotated, Any, Optional
 
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+)
 
-class PaginationParams(BaseModel):
-    """Common pagination parameters for list operations."""
+
+# Cheap shape check that accepts the overwhelmingly common case; only inputs
+# that fail it pay for full email-validator parsing.
+_FAST_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]{2,}$")
+
+
+@lru_cache(maxsize=1)
+def _email_adapter() -> Optional[TypeAdapter]:
+    """Build the EmailStr adapter once (None if email-validator is missing)."""
+    try:
+        return TypeAdapter(EmailStr)
+    except ImportError:
+        return None
+
+
+def validate_email(value: str) -> str:
+    """Validate an email address, using a regex fast path before EmailStr."""
+    if _FAST_EMAIL_RE.match(value):
+        return value
+    adapter = _email_adapter()
+    if adapter is None:
+        raise ValueError(f"Invalid email address: {value!r}")
+    return adapter.validate_python(value)
+
+
+EmailAddress = Annotated[str, AfterValidator(validate_email)]
+
+# Resource IDs interpolated into URL paths; the pattern is compiled once by
+# pydantic-core and rejects malformed IDs before an API round trip
+UUIDStr = Annotated[
+    str,
+    StringConstraints(
+        pattern=r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+    ),
+]
+
+# Shared constrained-int types so bounds are declared once
+PageLimit = Annotated[int, Field(ge=1, le=100)]
+Percent = Annotated[int, Field(ge=0, le=100)]
+CampaignDailyLimit = Annotated[int, Field(ge=1, le=50)]
+EmailGapMinutes = Annotated[int, Field(ge=1, le=1440)]
+
+# Email body text; the cap stops a runaway body before the HTML conversion
+# makes several full-size copies of it
+MAX_EMAIL_BODY_CHARS = 1_000_000
+EmailBodyText = Annotated[str, Field(max_length=MAX_EMAIL_BODY_CHARS)]
+
+
+# Config overlays shared by InputModel subclasses (merged over the base config)
+# Payload text is sent verbatim (no whitespace stripping)
+VERBATIM_CONFIG = ConfigDict(str_strip_whitespace=False)
+# Rarely used inputs: compile the validator on first use, not at import
+DEFERRED_CONFIG = ConfigDict(defer_build=True)
+
+
+class InputModel(BaseModel):
+    """
+    Base class for tool input models.
     
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        extra="ignore",
-    )
+    to_api_json() serializes in one pass without an intermediate dict.
+    
+    The shared config is defined once here so subclasses don't each carry
+    their own ConfigDict. Inputs are frozen: tools only ever read them.
+    """
+    
+    # Use extra="ignore" to be tolerant of unexpected fields from LLMs
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore", frozen=True)
+    
+    def to_api_json(self) -> bytes:
+        """Serialize set fields straight to JSON bytes for a request body."""
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True)
+
+
+class PaginationParams(InputModel):
+    """Common pagination parameters for list operations."""
     
-    limit: Optional[int] = Field(
+    limit: Optional[PageLimit] = Field(
         default=None,
-        ge=1,
-        le=100,
         description="Results per page (1-100, default: 100)"
     )
     starting_after: Optional[str] = Field(
@@ -35,11 +111,18 @@ class PaginationResponse(BaseModel):
     
     @classmethod
     def from_response(cls, data: dict, items_key: str = "items") -> "PaginationResponse":
-        """Parse API response into pagination response."""
-        items = data.get(items_key, data.get("data", []))
-        return cls(
+        """
+        Parse API response into pagination response.
+        
+        Uses model_construct: the shape is built right here from API data,
+        so re-validating every item through list[Any] is pure overhead.
+        """
+        # Only fall back to "data" when items_key is absent; read the cursor once
+        items = data[items_key] if items_key in data else data.get("data", [])
+        cursor = data.get("next_starting_after")
+        return cls.model_construct(
             items=items if isinstance(items, list) else [items],
-            next_starting_after=data.get("next_starting_after"),
-            has_more=bool(data.get("next_starting_after")),
+            next_starting_after=cursor,
+            has_more=bool(cursor),
         )
 
@@ -3,16 +3,15 @@ Pydantic models for Email operations.
 """
 
 from typing import Any, Literal, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import Field
 
+from .common import VERBATIM_CONFIG, InputModel, PageLimit, UUIDStr
 
-class ListEmailsInput(BaseModel):
+
+class ListEmailsInput(InputModel):
     """Input for listing emails with pagination and filtering."""
     
-    # Use extra="ignore" to be tolerant of unexpected fields from LLMs
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    limit: Optional[int] = Field(default=100, ge=1, le=100, description="Results per page (1-100, default: 100)")
+    limit: Optional[PageLimit] = Field(default=100, description="Results per page (1-100, default: 100)")
     starting_after: Optional[str] = Field(
         default=None, 
         description="Pagination cursor - use value from pagination.next_starting_after to get next page"
@@ -40,47 +39,50 @@ class ListEmailsInput(BaseModel):
     email_type: Optional[Literal["received", "sent", "manual"]] = Field(default=None)
 
 
-class GetEmailInput(BaseModel):
+class GetEmailInput(InputModel):
     """Input for getting email details."""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+    email_id: UUIDStr = Field(..., description="Email UUID")
+
+
+class GetEmailsBulkInput(InputModel):
+    """Input for getting several emails' details at once."""
     
-    email_id: str = Field(..., description="Email UUID")
+    email_ids: list[UUIDStr] = Field(
+        ..., min_length=1, max_length=50,
+        description="Email UUIDs to fetch (1-50)"
+    )
 
 
-class EmailBody(BaseModel):
+class EmailBody(InputModel):
     """Email body content."""
     
-    model_config = ConfigDict(extra="ignore")
+    model_config = VERBATIM_CONFIG
     
     html: Optional[str] = Field(default=None, description="HTML content")
     text: Optional[str] = Field(default=None, description="Plain text content")
 
 
-class ReplyToEmailInput(BaseModel):
+class ReplyToEmailInput(InputModel):
     """
     Input for replying to an email.
     
     🚨 SENDS REAL EMAIL! Confirm with user first. Cannot undo!
     """
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
     reply_to_uuid: str = Field(..., description="Email UUID to reply to")
     eaccount: str = Field(..., description="Sender account (must be active)")
     subject: str = Field(..., description="Subject line")
     body: EmailBody = Field(..., description="Email body (html or text)")
 
 
-class VerifyEmailInput(BaseModel):
+class VerifyEmailInput(InputModel):
     """
     Input for verifying email deliverability.
 
     Takes 5-45 seconds. Returns status, score, flags.
     """
 
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-
     email: str = Field(..., description="Email to verify")
     max_wait_seconds: Optional[int] = Field(
         default=45,
@@ -98,16 +100,18 @@ class VerifyEmailInput(BaseModel):
         default=False,
         description="Return immediately even if status is pending (default: false)"
     )
+    skip_cache: Optional[bool] = Field(
+        default=False,
+        description="Re-verify even if this address was verified in the last 10 minutes (default: false)"
+    )
 
 
-class MarkThreadAsReadInput(BaseModel):
+class MarkThreadAsReadInput(InputModel):
     """
     Input for marking an email thread as read.
 
     Marks all emails in the thread as read.
     """
 
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-
-    thread_id: str = Field(..., description="Thread UUID to mark as read")
+    thread_id: UUIDStr = Field(..., description="Thread UUID to mark as read")
 
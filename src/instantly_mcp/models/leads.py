@@ -3,15 +3,14 @@ Pydantic models for Lead and Lead List operations.
 """
 
 from typing import Any, Literal, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import Field, field_validator
 
+from .common import DEFERRED_CONFIG, VERBATIM_CONFIG, InputModel, PageLimit, UUIDStr
 
-class ListLeadsInput(BaseModel):
+
+class ListLeadsInput(InputModel):
     """Input for listing leads with pagination and filtering."""
     
-    # Use extra="ignore" to be tolerant of unexpected fields from LLMs
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
     campaign: Optional[str] = Field(default=None, description="Campaign UUID")
     list_id: Optional[str] = Field(default=None, description="List UUID")
     list_ids: Optional[list[str]] = Field(default=None, description="Multiple list UUIDs")
@@ -24,30 +23,35 @@ class ListLeadsInput(BaseModel):
         description="FILTER_VAL_CONTACTED, FILTER_VAL_NOT_CONTACTED, FILTER_VAL_COMPLETED, FILTER_VAL_ACTIVE, etc."
     )
     distinct_contacts: Optional[bool] = Field(default=None, description="Dedupe by email")
-    limit: Optional[int] = Field(default=100, ge=1, le=100, description="Results per page (1-100, default: 100)")
+    limit: Optional[PageLimit] = Field(default=100, description="Results per page (1-100, default: 100)")
     starting_after: Optional[str] = Field(
         default=None,
         description="Pagination cursor - use value from pagination.next_starting_after to get next page"
     )
 
 
-class GetLeadInput(BaseModel):
+class GetLeadInput(InputModel):
     """Input for getting lead details."""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+    lead_id: UUIDStr = Field(..., description="Lead UUID")
+
+
+class GetLeadsBulkInput(InputModel):
+    """Input for getting several leads' details at once."""
     
-    lead_id: str = Field(..., description="Lead UUID")
+    lead_ids: list[UUIDStr] = Field(
+        ..., min_length=1, max_length=100,
+        description="Lead UUIDs to fetch (1-100)"
+    )
 
 
-class CreateLeadInput(BaseModel):
+class CreateLeadInput(InputModel):
     """
     Input for creating a lead with custom variables.
     
     Use skip_if_in_campaign to prevent duplicates.
     """
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
     campaign: Optional[str] = Field(default=None, description="Campaign UUID")
     email: str = Field(..., description="Required - lead email address")
     first_name: Optional[str] = Field(default=None)
@@ -74,16 +78,16 @@ class CreateLeadInput(BaseModel):
     )
 
 
-class UpdateLeadInput(BaseModel):
+class UpdateLeadInput(InputModel):
     """
     Input for updating a lead (partial update).
     
     ⚠️ custom_variables replaces entire object - include existing values!
     """
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+    model_config = DEFERRED_CONFIG
     
-    lead_id: str = Field(..., description="Lead UUID")
+    lead_id: UUIDStr = Field(..., description="Lead UUID")
     personalization: Optional[str] = Field(default=None)
     website: Optional[str] = Field(default=None)
     last_name: Optional[str] = Field(default=None)
@@ -99,13 +103,10 @@ class UpdateLeadInput(BaseModel):
     )
 
 
-class ListLeadListsInput(BaseModel):
+class ListLeadListsInput(InputModel):
     """Input for listing lead lists with pagination."""
     
-    # Use extra="ignore" to be tolerant of unexpected fields from LLMs
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    limit: Optional[int] = Field(default=100, ge=1, le=100, description="Results per page (1-100, default: 100)")
+    limit: Optional[PageLimit] = Field(default=100, description="Results per page (1-100, default: 100)")
     starting_after: Optional[str] = Field(
         default=None, 
         description="Pagination cursor - use value from pagination.next_starting_after to get next page"
@@ -114,43 +115,37 @@ class ListLeadListsInput(BaseModel):
     search: Optional[str] = Field(default=None, description="Search by name")
 
 
-class CreateLeadListInput(BaseModel):
+class CreateLeadListInput(InputModel):
     """
     Input for creating a lead list.
     
     Set has_enrichment_task=true for auto-enrich.
     """
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
     name: str = Field(..., description="List name")
     has_enrichment_task: Optional[bool] = Field(default=None)
     owned_by: Optional[str] = Field(default=None, description="Owner UUID")
 
 
-class UpdateLeadListInput(BaseModel):
+class UpdateLeadListInput(InputModel):
     """Input for updating a lead list."""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    list_id: str = Field(..., description="List UUID")
+    list_id: UUIDStr = Field(..., description="List UUID")
     name: Optional[str] = Field(default=None)
     has_enrichment_task: Optional[bool] = Field(default=None)
     owned_by: Optional[str] = Field(default=None)
 
 
-class GetVerificationStatsInput(BaseModel):
+class GetVerificationStatsInput(InputModel):
     """Input for getting email verification stats for a list."""
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
-    list_id: str = Field(..., description="List UUID")
+    list_id: UUIDStr = Field(..., description="List UUID")
 
 
-class LeadData(BaseModel):
+class LeadData(InputModel):
     """Single lead data for bulk operations."""
     
-    model_config = ConfigDict(extra="ignore")
+    model_config = VERBATIM_CONFIG
     
     email: str = Field(..., description="Lead email (required)")
     first_name: Optional[str] = Field(default=None)
@@ -165,15 +160,14 @@ class LeadData(BaseModel):
     custom_variables: Optional[dict[str, Any]] = Field(default=None)
 
 
-class BulkAddLeadsInput(BaseModel):
+class BulkAddLeadsInput(InputModel):
     """
     Input for bulk adding leads (up to 1,000).
     
     10-100x faster than create_lead for large imports.
+    to_api_json() produces the POST /leads/add body directly.
     """
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-    
     leads: list[LeadData] = Field(
         ..., min_length=1, max_length=1000,
         description="1-1000 leads"
@@ -186,36 +180,38 @@ class BulkAddLeadsInput(BaseModel):
     skip_if_in_workspace: Optional[bool] = Field(default=None)
     skip_if_in_campaign: Optional[bool] = Field(default=None, description="Recommended")
     skip_if_in_list: Optional[bool] = Field(default=None)
+    
+    @field_validator("campaign_id", "list_id", "blocklist_id", "assigned_to")
+    @classmethod
+    def _blank_to_none(cls, value: Optional[str]) -> Optional[str]:
+        # Blank IDs mean "not provided" so to_api_json() leaves them out
+        return value or None
 
 
-class DeleteLeadInput(BaseModel):
+class DeleteLeadInput(InputModel):
     """Input for deleting a lead. 🗑️ PERMANENTLY delete. CANNOT UNDO!"""
 
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-
-    lead_id: str = Field(..., description="Lead UUID to DELETE")
+    lead_id: UUIDStr = Field(..., description="Lead UUID to DELETE")
 
 
-class DeleteLeadListInput(BaseModel):
+class DeleteLeadListInput(InputModel):
     """
     Input for deleting a lead list. ⚠️ PERMANENT - CANNOT UNDO!
 
     Requires user confirmation before executing.
     """
 
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
-
-    list_id: str = Field(..., description="Lead List UUID to DELETE PERMANENTLY")
+    list_id: UUIDStr = Field(..., description="Lead List UUID to DELETE PERMANENTLY")
 
 
-class MoveLeadsInput(BaseModel):
+class MoveLeadsInput(InputModel):
     """
     Input for moving or copying leads between campaigns/lists.
     
     Runs as background job for large operations.
     """
     
-    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+    model_config = DEFERRED_CONFIG
     
     to_campaign_id: Optional[str] = Field(
         default=None,
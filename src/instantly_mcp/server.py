@@ -4,7 +4,7 @@ Instantly MCP Server - Main Server
 A lightweight, robust FastMCP server for the Instantly.ai V2 API.
 
 Features:
-- 38 tools across 6 categories (accounts, campaigns, leads, emails, analytics, background_jobs)
+- 40 tools across 6 categories (accounts, campaigns, leads, emails, analytics, background_jobs)
 - Dual transport support (HTTP for remote, stdio for local)
 - Lazy loading via TOOL_CATEGORIES environment variable
 - Per-request API key support for multi-tenant deployments
@@ -21,6 +21,8 @@ Usage:
   TOOL_CATEGORIES=accounts,campaigns fastmcp run src/instantly_mcp/server.py
 """
 
+import asyncio
+import logging
 import os
 import sys
 from typing import Any
@@ -28,9 +30,32 @@ from typing import Any
 from fastmcp import FastMCP
 from fastmcp.server import Context
 
+from . import _json
 from .client import get_client, set_api_key
 from .tools import get_all_tools, get_requested_categories, is_lazy_loading_enabled
 
+logger = logging.getLogger("instantly_mcp")
+
+
+def _configure_logging() -> None:
+    """
+    Send package logs to stderr (stdout carries the stdio protocol).
+    
+    INSTANTLY_LOG_LEVEL sets the level. It defaults to WARNING so stdio
+    servers, whose stderr usually goes unread, skip formatting info lines;
+    main() raises it to INFO for HTTP mode unless the variable is set.
+    """
+    if logger.handlers:
+        return
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("[Instantly MCP] %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(os.environ.get("INSTANTLY_LOG_LEVEL", "WARNING").upper())
+    logger.propagate = False
+
+
+_configure_logging()
+
 # Server metadata
 SERVER_NAME = "instantly-mcp"
 SERVER_VERSION = "1.0.0"
@@ -38,7 +63,7 @@ SERVER_INSTRUCTIONS = """
 Instantly.ai V2 API MCP Server - Email automation and campaign management.
 
 Categories: accounts, campaigns, leads, emails, analytics, background_jobs
-Total tools: 38 (configurable via TOOL_CATEGORIES env var)
+Total tools: 40 (configurable via TOOL_CATEGORIES env var)
 
 Authentication methods for HTTP deployments:
 1. URL path: /mcp/YOUR_API_KEY
@@ -54,133 +79,163 @@ mcp = FastMCP(
 )
 
 
-def register_tools():
-    """Register all tools with MCP annotations."""
+# Tool annotations mapping
+# readOnlyHint: Tool only reads data
+# destructiveHint: Tool modifies/deletes data
+# idempotentHint: Repeating the call has no additional effect (safe to retry)
+# openWorldHint: Tool talks to an external system (the Instantly API)
+# confirmationRequiredHint: Requires user confirmation
+# Reads spell out destructiveHint=False: some clients assume True when omitted.
+READ_ONLY = {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True}
+WRITE = {"destructiveHint": False, "openWorldHint": True}
+DESTRUCTIVE = {"destructiveHint": True, "openWorldHint": True, "confirmationRequiredHint": True}
+
+TOOL_ANNOTATIONS = {
+    # Account tools
+    "list_accounts": READ_ONLY,
+    "get_account": READ_ONLY,
+    "create_account": WRITE,
+    "update_account": WRITE,
+    "manage_account_state": WRITE,
+    "delete_account": DESTRUCTIVE,
+
+    # Campaign tools
+    "create_campaign": WRITE,
+    "list_campaigns": READ_ONLY,
+    "get_campaign": READ_ONLY,
+    "update_campaign": WRITE,
+    "activate_campaign": WRITE,
+    "pause_campaign": WRITE,
+    "delete_campaign": DESTRUCTIVE,
+    "search_campaigns_by_contact": READ_ONLY,
+
+    # Lead tools
+    "list_leads": READ_ONLY,
+    "get_lead": READ_ONLY,
+    "get_leads_bulk": READ_ONLY,
+    "create_lead": WRITE,
+    "update_lead": WRITE,
+    "list_lead_lists": READ_ONLY,
+    "create_lead_list": WRITE,
+    "update_lead_list": WRITE,
+    "get_verification_stats_for_lead_list": READ_ONLY,
+    "add_leads_to_campaign_or_list_bulk": WRITE,
+    "delete_lead": DESTRUCTIVE,
+    "delete_lead_list": DESTRUCTIVE,
+    "move_leads_to_campaign_or_list": WRITE,
+
+    # Email tools
+    "list_emails": READ_ONLY,
+    "get_email": READ_ONLY,
+    "get_emails_bulk": READ_ONLY,
+    "reply_to_email": DESTRUCTIVE,
+    "count_unread_emails": READ_ONLY,
+    "verify_email": READ_ONLY,
+    "mark_thread_as_read": WRITE,
+
+    # Analytics tools
+    "get_campaign_analytics": READ_ONLY,
+    "get_daily_campaign_analytics": READ_ONLY,
+    "get_warmup_analytics": READ_ONLY,
+
+    # Background job tools
+    "list_background_jobs": READ_ONLY,
+    "get_background_job": READ_ONLY,
+}
+
+
+def register_tools() -> int:
+    """Register all tools with MCP annotations and return how many."""
     
     # Import tool modules dynamically based on categories
     tools = get_all_tools()
     
-    # Tool annotations mapping
-    # readOnlyHint: Tool only reads data
-    # destructiveHint: Tool modifies/deletes data
-    # confirmationRequiredHint: Requires user confirmation
-    TOOL_ANNOTATIONS = {
-        # Account tools
-        "list_accounts": {"readOnlyHint": True},
-        "get_account": {"readOnlyHint": True},
-        "create_account": {"destructiveHint": False},
-        "update_account": {"destructiveHint": False},
-        "manage_account_state": {"destructiveHint": False},
-        "delete_account": {"destructiveHint": True, "confirmationRequiredHint": True},
-
-        # Campaign tools
-        "create_campaign": {"destructiveHint": False},
-        "list_campaigns": {"readOnlyHint": True},
-        "get_campaign": {"readOnlyHint": True},
-        "update_campaign": {"destructiveHint": False},
-        "activate_campaign": {"destructiveHint": False},
-        "pause_campaign": {"destructiveHint": False},
-        "delete_campaign": {"destructiveHint": True, "confirmationRequiredHint": True},
-        "search_campaigns_by_contact": {"readOnlyHint": True},
-
-        # Lead tools
-        "list_leads": {"readOnlyHint": True},
-        "get_lead": {"readOnlyHint": True},
-        "create_lead": {"destructiveHint": False},
-        "update_lead": {"destructiveHint": False},
-        "list_lead_lists": {"readOnlyHint": True},
-        "create_lead_list": {"destructiveHint": False},
-        "update_lead_list": {"destructiveHint": False},
-        "get_verification_stats_for_lead_list": {"readOnlyHint": True},
-        "add_leads_to_campaign_or_list_bulk": {"destructiveHint": False},
-        "delete_lead": {"destructiveHint": True, "confirmationRequiredHint": True},
-        "delete_lead_list": {"destructiveHint": True, "confirmationRequiredHint": True},
-        "move_leads_to_campaign_or_list": {"destructiveHint": False},
-
-        # Email tools
-        "list_emails": {"readOnlyHint": True},
-        "get_email": {"readOnlyHint": True},
-        "reply_to_email": {"destructiveHint": True, "confirmationRequiredHint": True},
-        "count_unread_emails": {"readOnlyHint": True},
-        "verify_email": {"readOnlyHint": True},
-        "mark_thread_as_read": {"destructiveHint": False},
-
-        # Analytics tools
-        "get_campaign_analytics": {"readOnlyHint": True},
-        "get_daily_campaign_analytics": {"readOnlyHint": True},
-        "get_warmup_analytics": {"readOnlyHint": True},
-
-        # Background job tools
-        "list_background_jobs": {"readOnlyHint": True},
-        "get_background_job": {"readOnlyHint": True},
-    }
-    
     for tool_func in tools:
         tool_name = tool_func.__name__
-        annotations = TOOL_ANNOTATIONS.get(tool_name, {})
         
         # Register tool with FastMCP
         mcp.tool(
             name=tool_name,
-            annotations=annotations,
+            annotations=TOOL_ANNOTATIONS.get(tool_name),
         )(tool_func)
     
-    print(f"[Instantly MCP] ✅ Registered {len(tools)} tools", file=sys.stderr)
+    return len(tools)
+
+
+def _log_registration() -> None:
+    """Log the tool registration summary (once the log level is final)."""
+    logger.info("✅ Registered %d tools", REGISTERED_TOOL_COUNT)
     if is_lazy_loading_enabled():
-        categories = get_requested_categories()
-        print(f"[Instantly MCP] 📦 Categories: {', '.join(categories)}", file=sys.stderr)
+        logger.info("📦 Categories: %s", ", ".join(get_requested_categories()))
 
 
-# Register tools at import time
-register_tools()
+# Register tools at import time: `fastmcp run` and `uvicorn ...:mcp.app` use
+# this module's `mcp` without calling main(). Only categories selected by
+# TOOL_CATEGORIES are imported (tool modules and their models alike).
+REGISTERED_TOOL_COUNT = register_tools()
+if logger.isEnabledFor(logging.INFO):
+    _log_registration()
+
+
+# Tools per category (get_server_info itself is counted in total_tools)
+TOOL_COUNTS = {
+    "accounts": 6,
+    "campaigns": 8,
+    "leads": 13,
+    "emails": 7,
+    "analytics": 3,
+    "background_jobs": 2,
+}
+
+
+def _build_static_server_info() -> dict[str, Any]:
+    """Server info that is fixed once tools are registered."""
+    categories = get_requested_categories()
+    tool_counts = {
+        category: count if category in categories else 0
+        for category, count in TOOL_COUNTS.items()
+    }
+    return {
+        "lazy_loading_enabled": is_lazy_loading_enabled(),
+        "loaded_categories": list(categories),
+        "tool_counts": tool_counts,
+        "total_tools": sum(tool_counts.values()) + 1,  # +1 for get_server_info
+    }
+
+
+_STATIC_SERVER_INFO = _build_static_server_info()
 
 
 @mcp.tool(
     name="get_server_info",
-    annotations={"readOnlyHint": True},
+    annotations={**READ_ONLY, "openWorldHint": False},
 )
 async def get_server_info() -> str:
     """
     Get Instantly MCP server information.
     
-    Returns server version, loaded categories, and configuration status.
+    Returns server version, loaded categories, configuration status, and
+    response cache statistics.
     Useful for debugging and verifying server setup.
     """
-    import json
     
     client = get_client()
-    categories = get_requested_categories()
+    reset_at = client.rate_limit.reset_at_dt()
     
     info = {
         "server": SERVER_NAME,
         "version": SERVER_VERSION,
         "api_key_configured": client.has_api_key,
-        "lazy_loading_enabled": is_lazy_loading_enabled(),
-        "loaded_categories": categories,
-        "tool_counts": {
-            "accounts": 6 if "accounts" in categories else 0,
-            "campaigns": 8 if "campaigns" in categories else 0,  # +2: delete_campaign, search_campaigns_by_contact
-            "leads": 12 if "leads" in categories else 0,  # +1: delete_lead_list
-            "emails": 6 if "emails" in categories else 0,  # +1: mark_thread_as_read
-            "analytics": 3 if "analytics" in categories else 0,
-            "background_jobs": 2 if "background_jobs" in categories else 0,
-        },
-        "total_tools": sum([
-            6 if "accounts" in categories else 0,
-            8 if "campaigns" in categories else 0,
-            12 if "leads" in categories else 0,
-            6 if "emails" in categories else 0,
-            3 if "analytics" in categories else 0,
-            2 if "background_jobs" in categories else 0,
-        ]) + 1,  # +1 for get_server_info
+        **_STATIC_SERVER_INFO,
         "rate_limit": {
             "remaining": client.rate_limit.remaining,
             "limit": client.rate_limit.limit,
-            "reset_at": client.rate_limit.reset_at.isoformat() if client.rate_limit.reset_at else None,
+            "reset_at": reset_at.isoformat() if reset_at else None,
         },
+        "cache": client.cache.stats(),
     }
     
-    return json.dumps(info, indent=2)
+    return _json.dumps(info)
 
 
 def extract_api_key_from_request(ctx: Context) -> str | None:
@@ -213,6 +268,20 @@ def extract_api_key_from_request(ctx: Context) -> str | None:
     return None
 
 
+async def _run_stdio() -> None:
+    """
+    Serve stdio, then release the shared API client's pooled connections.
+    
+    The client is closed here rather than in a FastMCP lifespan: some FastMCP
+    releases run the lifespan per session, which would close the shared pool
+    under other sessions' in-flight requests.
+    """
+    try:
+        await mcp.run_async(transport="stdio")
+    finally:
+        await get_client().aclose()
+
+
 def main():
     """Main entry point for the Instantly MCP server."""
     import argparse
@@ -246,28 +315,34 @@ def main():
     if args.api_key:
         set_api_key(args.api_key)
     
+    # HTTP servers show their startup banner unless a level was chosen
+    if args.transport == "http" and "INSTANTLY_LOG_LEVEL" not in os.environ:
+        logger.setLevel(logging.INFO)
+        # Registration ran at import, before the level was raised
+        _log_registration()
+    
     # Log startup info
     client = get_client()
-    print(f"[Instantly MCP] 🚀 Starting server v{SERVER_VERSION}", file=sys.stderr)
-    print(f"[Instantly MCP] 🔑 API key: {'✅ Configured' if client.has_api_key else '❌ Not set (multi-tenant mode)'}", file=sys.stderr)
-    print(f"[Instantly MCP] 🚌 Transport: {args.transport}", file=sys.stderr)
+    logger.info("🚀 Starting server v%s", SERVER_VERSION)
+    logger.info("🔑 API key: %s", "✅ Configured" if client.has_api_key else "❌ Not set (multi-tenant mode)")
+    logger.info("🚌 Transport: %s", args.transport)
     
     if args.transport == "http":
-        print(f"[Instantly MCP] 🌐 HTTP endpoints:", file=sys.stderr)
-        print(f"[Instantly MCP]    - http://{args.host}:{args.port}/mcp", file=sys.stderr)
-        print(f"[Instantly MCP]    - http://{args.host}:{args.port}/mcp/YOUR_API_KEY", file=sys.stderr)
+        logger.info("🌐 HTTP endpoints:")
+        logger.info("   - http://%s:%s/mcp", args.host, args.port)
+        logger.info("   - http://%s:%s/mcp/YOUR_API_KEY", args.host, args.port)
         if not client.has_api_key:
-            print(f"[Instantly MCP] ⚠️  Multi-tenant mode: Provide API key via URL or headers", file=sys.stderr)
+            logger.warning("⚠️  Multi-tenant mode: Provide API key via URL or headers")
         
         # Use custom HTTP app with URL-based auth support
         from .http_app import run_http_server
         run_http_server(mcp, host=args.host, port=args.port)
     else:
         if not client.has_api_key:
-            print("[Instantly MCP] ❌ API key required for stdio mode", file=sys.stderr)
-            print("[Instantly MCP] Set INSTANTLY_API_KEY env var or use --api-key", file=sys.stderr)
+            logger.error("❌ API key required for stdio mode")
+            logger.error("Set INSTANTLY_API_KEY env var or use --api-key")
             sys.exit(1)
-        mcp.run(transport="stdio")
+        asyncio.run(_run_stdio())
 
 
 if __name__ == "__main__":
@@ -5,64 +5,72 @@ All tool implementations organized by category.
 Supports lazy loading via TOOL_CATEGORIES environment variable.
 """
 
+import logging
 import os
+from functools import lru_cache
+from importlib import import_module
 from typing import Callable
 
+logger = logging.getLogger(__name__)
+
 # Category mapping for lazy loading
 CATEGORY_MAP: dict[str, list[Callable]] = {}
 
 
-def get_available_categories() -> list[str]:
-    """Get list of available tool categories."""
-    return ["accounts", "campaigns", "leads", "emails", "analytics", "background_jobs"]
+AVAILABLE_CATEGORIES = ("accounts", "campaigns", "leads", "emails", "analytics", "background_jobs")
+
+
+def get_available_categories() -> tuple[str, ...]:
+    """Get available tool categories."""
+    return AVAILABLE_CATEGORIES
 
 
+# TOOL_CATEGORIES is read once: tools are registered at import and never reloaded
+@lru_cache(maxsize=1)
 def is_lazy_loading_enabled() -> bool:
     """Check if lazy loading is active."""
     return bool(os.environ.get("TOOL_CATEGORIES"))
 
 
-def get_requested_categories() -> list[str]:
-    """Get list of categories requested via TOOL_CATEGORIES env var."""
+@lru_cache(maxsize=1)
+def get_requested_categories() -> tuple[str, ...]:
+    """Get categories requested via TOOL_CATEGORIES env var."""
     categories_env = os.environ.get("TOOL_CATEGORIES", "")
     if not categories_env:
-        return get_available_categories()
+        return AVAILABLE_CATEGORIES
     
     requested = [c.strip().lower() for c in categories_env.split(",") if c.strip()]
-    valid = [c for c in requested if c in get_available_categories()]
+    valid = tuple(c for c in requested if c in AVAILABLE_CATEGORIES)
     
     if not valid:
-        print(f"[Instantly MCP] ⚠️ No valid categories in TOOL_CATEGORIES. Loading all.")
-        return get_available_categories()
+        logger.warning("⚠️ No valid categories in TOOL_CATEGORIES. Loading all.")
+        return AVAILABLE_CATEGORIES
     
     invalid = set(requested) - set(valid)
     if invalid:
-        print(f"[Instantly MCP] ⚠️ Unknown categories ignored: {invalid}")
+        logger.warning("⚠️ Unknown categories ignored: %s", invalid)
     
     return valid
 
 
+# Category -> (submodule, exported tool list); modules are imported on demand
+_CATEGORY_MODULES: dict[str, tuple[str, str]] = {
+    "accounts": (".accounts", "ACCOUNT_TOOLS"),
+    "campaigns": (".campaigns", "CAMPAIGN_TOOLS"),
+    "leads": (".leads", "LEAD_TOOLS"),
+    "emails": (".emails", "EMAIL_TOOLS"),
+    "analytics": (".analytics", "ANALYTICS_TOOLS"),
+    "background_jobs": (".background_jobs", "BACKGROUND_JOB_TOOLS"),
+}
+
+
 def load_tools_for_category(category: str) -> list[Callable]:
     """Load tools for a specific category."""
-    if category == "accounts":
-        from .accounts import ACCOUNT_TOOLS
-        return ACCOUNT_TOOLS
-    elif category == "campaigns":
-        from .campaigns import CAMPAIGN_TOOLS
-        return CAMPAIGN_TOOLS
-    elif category == "leads":
-        from .leads import LEAD_TOOLS
-        return LEAD_TOOLS
-    elif category == "emails":
-        from .emails import EMAIL_TOOLS
-        return EMAIL_TOOLS
-    elif category == "analytics":
-        from .analytics import ANALYTICS_TOOLS
-        return ANALYTICS_TOOLS
-    elif category == "background_jobs":
-        from .background_jobs import BACKGROUND_JOB_TOOLS
-        return BACKGROUND_JOB_TOOLS
-    return []
+    entry = _CATEGORY_MODULES.get(category)
+    if entry is None:
+        return []
+    module_name, attr = entry
+    return getattr(import_module(module_name, __name__), attr)
 
 
 def get_all_tools() -> list[Callable]:
@@ -74,7 +82,7 @@ def get_all_tools() -> list[Callable]:
         tools.extend(load_tools_for_category(category))
     
     if is_lazy_loading_enabled():
-        print(f"[Instantly MCP] 🔧 Lazy loading enabled: {len(tools)} tools from categories: {', '.join(categories)}")
+        logger.info("🔧 Lazy loading enabled: %d tools from categories: %s", len(tools), ", ".join(categories))
     
     return tools
 
@@ -4,10 +4,11 @@ Instantly MCP Server - Account Tools
 6 tools for email account management operations.
 """
 
-import json
 from typing import Any, Optional
-from urllib.parse import quote
 
+from .. import _json
+from .._fields import set_fields
+from .._urls import quote_email
 from ..client import get_client
 from ..models.accounts import (
     ListAccountsInput,
@@ -18,6 +19,9 @@ from ..models.accounts import (
     DeleteAccountInput,
 )
 
+# Query parameters forwarded by list_accounts, in API order
+_LIST_ACCOUNTS_FIELDS = ("limit", "starting_after", "search", "status", "provider_code", "tag_ids")
+
 
 async def list_accounts(params: Optional[ListAccountsInput] = None) -> str:
     """
@@ -39,33 +43,13 @@ async def list_accounts(params: Optional[ListAccountsInput] = None) -> str:
     if params is None:
         params = ListAccountsInput(limit=100)
     
-    query_params = {}
-    if params.limit:
-        query_params["limit"] = params.limit
-    else:
-        # Default to 100 results if no limit specified
-        query_params["limit"] = 100
-    if params.starting_after:
-        query_params["starting_after"] = params.starting_after
-    if params.search:
-        query_params["search"] = params.search
-    if params.status is not None:
-        query_params["status"] = params.status
-    if params.provider_code is not None:
-        query_params["provider_code"] = params.provider_code
-    if params.tag_ids:
-        query_params["tag_ids"] = params.tag_ids
+    # Unset and blank filters are omitted; limit defaults to 100
+    query_params = set_fields(params, _LIST_ACCOUNTS_FIELDS)
+    query_params.setdefault("limit", 100)
     
     result = await client.get("/accounts", params=query_params)
     
-    # Add pagination guidance for LLMs
-    if isinstance(result, dict):
-        pagination = result.get("pagination", {})
-        next_cursor = pagination.get("next_starting_after")
-        if next_cursor:
-            result["_pagination_hint"] = f"MORE RESULTS AVAILABLE. Call list_accounts with starting_after='{next_cursor}' to get next page."
-    
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def get_account(params: GetAccountInput) -> str:
@@ -79,9 +63,9 @@ async def get_account(params: GetAccountInput) -> str:
     - Tracking domain settings
     """
     client = get_client()
-    email_encoded = quote(params.email, safe="")
+    email_encoded = quote_email(params.email)
     result = await client.get(f"/accounts/{email_encoded}")
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def create_account(params: CreateAccountInput) -> str:
@@ -114,7 +98,7 @@ async def create_account(params: CreateAccountInput) -> str:
     }
     
     result = await client.post("/accounts", json=body)
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def update_account(params: UpdateAccountInput) -> str:
@@ -131,36 +115,23 @@ async def update_account(params: UpdateAccountInput) -> str:
     Only include fields you want to update.
     """
     client = get_client()
-    email_encoded = quote(params.email, safe="")
-    
-    body = {}
-    if params.first_name is not None:
-        body["first_name"] = params.first_name
-    if params.last_name is not None:
-        body["last_name"] = params.last_name
-    if params.warmup is not None:
-        warmup_dict = params.warmup.model_dump(exclude_none=True)
-        if warmup_dict:
-            body["warmup"] = warmup_dict
-    if params.daily_limit is not None:
-        body["daily_limit"] = params.daily_limit
-    if params.sending_gap is not None:
-        body["sending_gap"] = params.sending_gap
-    if params.enable_slow_ramp is not None:
-        body["enable_slow_ramp"] = params.enable_slow_ramp
-    if params.tracking_domain_name is not None:
-        body["tracking_domain_name"] = params.tracking_domain_name
-    if params.tracking_domain_status is not None:
-        body["tracking_domain_status"] = params.tracking_domain_status
-    if params.skip_cname_check is not None:
-        body["skip_cname_check"] = params.skip_cname_check
-    if params.remove_tracking_domain is not None:
-        body["remove_tracking_domain"] = params.remove_tracking_domain
-    if params.inbox_placement_test_limit is not None:
-        body["inbox_placement_test_limit"] = params.inbox_placement_test_limit
+    email_encoded = quote_email(params.email)
+    
+    # Partial update: only fields the caller set are sent
+    body = params.model_dump(exclude={"email"}, exclude_none=True)
+    if not body.get("warmup", True):
+        del body["warmup"]
     
     result = await client.patch(f"/accounts/{email_encoded}", json=body)
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
+
+
+# manage_account_state actions that take the email in the body, not the path
+_BULK_ACTION_ENDPOINTS = {
+    "enable_warmup": "/accounts/warmup/enable",
+    "disable_warmup": "/accounts/warmup/disable",
+    "test_vitals": "/accounts/test/vitals",
+}
 
 
 async def manage_account_state(params: ManageAccountStateInput) -> str:
@@ -177,29 +148,16 @@ async def manage_account_state(params: ManageAccountStateInput) -> str:
     Use test_vitals to diagnose connection issues.
     """
     client = get_client()
-    email_encoded = quote(params.email, safe="")
-    
-    action_endpoints = {
-        "pause": f"/accounts/{email_encoded}/pause",
-        "resume": f"/accounts/{email_encoded}/resume",
-        "enable_warmup": "/accounts/warmup/enable",
-        "disable_warmup": "/accounts/warmup/disable",
-        "test_vitals": "/accounts/test/vitals",
-    }
-    
-    endpoint = action_endpoints[params.action]
     
-    # Different actions have different body requirements
-    if params.action in ["pause", "resume"]:
-        result = await client.post(endpoint)
-    elif params.action in ["enable_warmup", "disable_warmup"]:
-        # V2 API expects an array of emails for warmup enable/disable
-        result = await client.post(endpoint, json={"emails": [params.email]})
-    else:  # test_vitals
-        # V2 API expects an array of emails for test vitals
+    endpoint = _BULK_ACTION_ENDPOINTS.get(params.action)
+    if endpoint is None:
+        # pause/resume: the account is in the path, no body
+        result = await client.post(f"/accounts/{quote_email(params.email)}/{params.action}")
+    else:
+        # V2 API expects an array of emails for warmup and test vitals
         result = await client.post(endpoint, json={"emails": [params.email]})
     
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def delete_account(params: DeleteAccountInput) -> str:
@@ -214,9 +172,9 @@ async def delete_account(params: DeleteAccountInput) -> str:
     Confirm with user before executing!
     """
     client = get_client()
-    email_encoded = quote(params.email, safe="")
+    email_encoded = quote_email(params.email)
     result = await client.delete(f"/accounts/{email_encoded}")
-    return json.dumps({"success": True, "deleted": params.email, **result}, indent=2)
+    return _json.dumps({"success": True, "deleted": params.email, **result})
 
 
 # Export all account tools
@@ -4,9 +4,9 @@ Instantly MCP Server - Analytics Tools
 3 tools for analytics and reporting operations.
 """
 
-import json
 from typing import Any, Optional
 
+from .. import _json
 from ..client import get_client
 from ..models.analytics import (
     GetCampaignAnalyticsInput,
@@ -41,17 +41,11 @@ async def get_campaign_analytics(params: Optional[GetCampaignAnalyticsInput] = N
     
     query_params: dict[str, Any] = {}
     
-    if params.campaign_id:
-        query_params["id"] = params.campaign_id
-    if params.campaign_ids:
-        # API expects multiple id params for multiple campaigns
-        for cid in params.campaign_ids:
-            if "id" not in query_params:
-                query_params["id"] = []
-            if isinstance(query_params["id"], list):
-                query_params["id"].append(cid)
-            else:
-                query_params["id"] = [query_params["id"], cid]
+    # API expects one repeated id param per campaign (httpx expands lists)
+    ids = [params.campaign_id] if params.campaign_id else []
+    ids.extend(params.campaign_ids or ())
+    if ids:
+        query_params["id"] = ids
     if params.start_date:
         query_params["start_date"] = params.start_date
     if params.end_date:
@@ -60,7 +54,7 @@ async def get_campaign_analytics(params: Optional[GetCampaignAnalyticsInput] = N
         query_params["exclude_total_leads_count"] = params.exclude_total_leads_count
     
     result = await client.get("/campaigns/analytics", params=query_params)
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def get_daily_campaign_analytics(params: Optional[GetDailyCampaignAnalyticsInput] = None) -> str:
@@ -104,7 +98,7 @@ async def get_daily_campaign_analytics(params: Optional[GetDailyCampaignAnalytic
         query_params["campaign_status"] = params.campaign_status
     
     result = await client.get("/campaigns/analytics/daily", params=query_params)
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def get_warmup_analytics(params: Optional[GetWarmupAnalyticsInput] = None) -> str:
@@ -143,9 +137,10 @@ async def get_warmup_analytics(params: Optional[GetWarmupAnalyticsInput] = None)
     if params.end_date:
         body["end_date"] = params.end_date
 
-    # API requires POST with JSON body, not GET with query params
-    result = await client.post("/accounts/warmup-analytics", json=body)
-    return json.dumps(result, indent=2)
+    # API requires POST with JSON body, not GET with query params; it is
+    # still a read, so it is cached and leaves other cached reads intact
+    result = await client.post("/accounts/warmup-analytics", json=body, read_only=True)
+    return _json.dumps(result)
 
 
 # Export all analytics tools
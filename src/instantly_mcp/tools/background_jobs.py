@@ -11,15 +11,19 @@ Background jobs are created when you perform bulk operations like:
 These tools let you check the status of those async operations.
 """
 
-import json
 from typing import Optional
 
+from .. import _json
+from .._fields import set_fields
 from ..client import get_client
 from ..models.background_jobs import (
     ListBackgroundJobsInput,
     GetBackgroundJobInput,
 )
 
+# Query parameters forwarded by list_background_jobs
+_LIST_BACKGROUND_JOBS_FIELDS = ("limit", "starting_after")
+
 
 async def list_background_jobs(params: Optional[ListBackgroundJobsInput] = None) -> str:
     """
@@ -48,24 +52,12 @@ async def list_background_jobs(params: Optional[ListBackgroundJobsInput] = None)
     if params is None:
         params = ListBackgroundJobsInput(limit=100)
     
-    query_params = {}
-    if params.limit:
-        query_params["limit"] = params.limit
-    else:
-        query_params["limit"] = 100
-    if params.starting_after:
-        query_params["starting_after"] = params.starting_after
+    query_params = set_fields(params, _LIST_BACKGROUND_JOBS_FIELDS)
+    query_params.setdefault("limit", 100)
     
     result = await client.get("/background-jobs", params=query_params)
     
-    # Add pagination guidance for LLMs
-    if isinstance(result, dict):
-        pagination = result.get("pagination", {})
-        next_cursor = pagination.get("next_starting_after")
-        if next_cursor:
-            result["_pagination_hint"] = f"MORE RESULTS AVAILABLE. Call list_background_jobs with starting_after='{next_cursor}' to get next page."
-    
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def get_background_job(params: GetBackgroundJobInput) -> str:
@@ -83,7 +75,7 @@ async def get_background_job(params: GetBackgroundJobInput) -> str:
     """
     client = get_client()
     result = await client.get(f"/background-jobs/{params.job_id}")
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 # Export all background job tools
@@ -11,10 +11,11 @@ Implements the Instantly.ai V2 API campaign structure which requires:
 - campaign_schedule.schedules[].days uses string keys ("0"-"6")
 """
 
-import json
+import logging
 import re
 from typing import Any, Optional
 
+from .. import _json
 from ..client import get_client
 from ..models.campaigns import (
     CreateCampaignInput,
@@ -28,6 +29,22 @@ from ..models.campaigns import (
     DEFAULT_TIMEZONE,
 )
 
+logger = logging.getLogger(__name__)
+
+# Subjects must be a single line
+_SUBJECT_LINEBREAK_RE = re.compile(r"[\r\n]+")
+
+# Weekdays only; shared by every new campaign's schedule (never mutated)
+DEFAULT_SCHEDULE_DAYS = {
+    "0": False,  # Sunday
+    "1": True,   # Monday
+    "2": True,   # Tuesday
+    "3": True,   # Wednesday
+    "4": True,   # Thursday
+    "5": True,   # Friday
+    "6": False,  # Saturday
+}
+
 
 def convert_line_breaks_to_html(text: str) -> str:
     """
@@ -47,23 +64,26 @@ def convert_line_breaks_to_html(text: str) -> str:
     if not text or not isinstance(text, str):
         return ""
 
-    # Normalize line endings to \n
-    normalized = text.replace("\r\n", "\n").replace("\r", "\n")
+    # Normalize line endings to \n (most bodies have no \r at all)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     # Split by double line breaks to create paragraphs
-    paragraphs = normalized.split("\n\n")
+    paragraphs = text.split("\n\n")
 
     result_parts = []
     for paragraph in paragraphs:
+        paragraph = paragraph.strip()
         # Skip empty paragraphs
-        if not paragraph.strip():
+        if not paragraph:
             continue
 
         # Convert single line breaks within paragraphs to <br /> tags
-        with_breaks = paragraph.strip().replace("\n", "<br />")
+        if "\n" in paragraph:
+            paragraph = paragraph.replace("\n", "<br />")
 
         # Wrap in paragraph tags for proper HTML structure
-        result_parts.append(f"<p>{with_breaks}</p>")
+        result_parts.append(f"<p>{paragraph}</p>")
 
     return "".join(result_parts)
 
@@ -99,16 +119,33 @@ async def create_campaign(params: CreateCampaignInput) -> str:
             accounts_result = await client.get("/accounts", params={"limit": 100})
             accounts = accounts_result.get("items", []) if isinstance(accounts_result, dict) else []
 
-            # Filter for eligible accounts (active, setup complete, warmup complete)
-            eligible_accounts = [
-                acc for acc in accounts
-                if acc.get("status") == 1
-                and not acc.get("setup_pending")
-                and acc.get("warmup_status") == 1
-            ]
+            # Classify accounts in one pass: eligible ones (active, setup
+            # complete, warmup complete) are listed for selection, and the
+            # first 10 others are reported with their issues
+            eligible_list = []
+            account_issues = []
+            for acc in accounts:
+                status = acc.get("status")
+                setup_pending = acc.get("setup_pending")
+                warmup_status = acc.get("warmup_status")
+                if status == 1 and not setup_pending and warmup_status == 1:
+                    eligible_list.append({
+                        "email": acc.get("email"),
+                        "warmup_score": acc.get("warmup_score", 0),
+                        "status": "ready"
+                    })
+                elif len(account_issues) < 10:
+                    issues = []
+                    if status != 1:
+                        issues.append("Account not active")
+                    if setup_pending:
+                        issues.append("Setup pending")
+                    if warmup_status != 1:
+                        issues.append("Warmup not complete")
+                    account_issues.append({"email": acc.get("email"), "issues": issues})
 
             if not accounts:
-                return json.dumps({
+                return _json.dumps({
                     "success": False,
                     "stage": "no_accounts",
                     "message": "❌ No accounts found in your workspace.",
@@ -119,24 +156,10 @@ async def create_campaign(params: CreateCampaignInput) -> str:
                         "4. Complete warmup process for each account",
                         "5. Then retry campaign creation"
                     ]
-                }, indent=2)
+                })
 
-            if not eligible_accounts:
-                account_issues = [
-                    {
-                        "email": acc.get("email"),
-                        "issues": [
-                            issue for issue in [
-                                "Account not active" if acc.get("status") != 1 else None,
-                                "Setup pending" if acc.get("setup_pending") else None,
-                                "Warmup not complete" if acc.get("warmup_status") != 1 else None
-                            ] if issue
-                        ]
-                    }
-                    for acc in accounts[:10]
-                ]
-
-                return json.dumps({
+            if not eligible_list:
+                return _json.dumps({
                     "success": False,
                     "stage": "no_eligible_accounts",
                     "message": "❌ No eligible sender accounts found for campaign creation.",
@@ -147,27 +170,18 @@ async def create_campaign(params: CreateCampaignInput) -> str:
                         "Setup must be complete (no pending setup)",
                         "Warmup must be complete (warmup_status = 1)"
                     ]
-                }, indent=2)
+                })
 
             # Return eligible accounts for user to select
-            eligible_list = [
-                {
-                    "email": acc.get("email"),
-                    "warmup_score": acc.get("warmup_score", 0),
-                    "status": "ready"
-                }
-                for acc in eligible_accounts
-            ]
-
-            return json.dumps({
+            return _json.dumps({
                 "success": False,
                 "stage": "account_selection_required",
                 "message": "📋 Eligible Sender Accounts Found",
-                "total_eligible_accounts": len(eligible_accounts),
+                "total_eligible_accounts": len(eligible_list),
                 "total_accounts": len(accounts),
                 "eligible_accounts": eligible_list,
                 "instructions": (
-                    f"✅ Found {len(eligible_accounts)} eligible sender accounts.\n\n"
+                    f"✅ Found {len(eligible_list)} eligible sender accounts.\n\n"
                     "📝 Next Step:\n"
                     "Call create_campaign again with the email_list parameter containing "
                     "the sender emails you want to use.\n\n"
@@ -178,7 +192,7 @@ async def create_campaign(params: CreateCampaignInput) -> str:
                     "parameter": "email_list",
                     "example": [acc["email"] for acc in eligible_list[:3]]
                 }
-            }, indent=2)
+            })
 
         except Exception as e:
             # If account discovery fails, proceed anyway with a warning
@@ -198,6 +212,7 @@ async def create_campaign(params: CreateCampaignInput) -> str:
     num_steps = params.sequence_steps or 1
     step_delay_days = params.step_delay_days or 3
     steps = []
+    main_html: Optional[str] = None
 
     for i in range(num_steps):
         # Determine subject for this step
@@ -209,18 +224,20 @@ async def create_campaign(params: CreateCampaignInput) -> str:
             subject = f"Follow-up: {params.subject}"
 
         # Clean subject (no line breaks allowed)
-        subject = re.sub(r"[\r\n]+", " ", subject).strip()
+        subject = _SUBJECT_LINEBREAK_RE.sub(" ", subject).strip()
 
-        # Determine body for this step
+        # Determine body for this step and convert it to HTML for proper
+        # email rendering. Default follow-ups prepend one paragraph to the
+        # main body, so its HTML is built once and reused.
         if params.sequence_bodies and i < len(params.sequence_bodies):
-            body_text = params.sequence_bodies[i]
-        elif i == 0:
-            body_text = params.body
+            html_body = convert_line_breaks_to_html(params.sequence_bodies[i])
         else:
-            body_text = f"This is follow-up #{i}.\n\n{params.body}"
-
-        # Convert body to HTML for proper email rendering
-        html_body = convert_line_breaks_to_html(body_text)
+            if main_html is None:
+                main_html = convert_line_breaks_to_html(params.body)
+            if i == 0:
+                html_body = main_html
+            else:
+                html_body = f"<p>This is follow-up #{i}.</p>{main_html}"
 
         # Build step with CORRECT V2 API structure
         step: dict[str, Any] = {
@@ -265,15 +282,7 @@ async def create_campaign(params: CreateCampaignInput) -> str:
                 "from": params.timing_from or "09:00",
                 "to": params.timing_to or "17:00",
             },
-            "days": {
-                "0": False,  # Sunday
-                "1": True,   # Monday
-                "2": True,   # Tuesday
-                "3": True,   # Wednesday
-                "4": True,   # Thursday
-                "5": True,   # Friday
-                "6": False,  # Saturday
-            }
+            "days": DEFAULT_SCHEDULE_DAYS,
         }]
     }
 
@@ -293,10 +302,12 @@ async def create_campaign(params: CreateCampaignInput) -> str:
     # Add success metadata
     if isinstance(result, dict):
         result["_success"] = True
-        result["_payload_used"] = body
+        # Echoing the full payload roughly doubles the response; debug only
+        if logger.isEnabledFor(logging.DEBUG):
+            result["_payload_used"] = body
         result["_message"] = "Campaign created successfully with API v2 compliant payload"
 
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def list_campaigns(params: Optional[ListCampaignsInput] = None) -> str:
@@ -334,14 +345,7 @@ async def list_campaigns(params: Optional[ListCampaignsInput] = None) -> str:
     
     result = await client.get("/campaigns", params=query_params)
     
-    # Add pagination guidance for LLMs
-    if isinstance(result, dict):
-        pagination = result.get("pagination", {})
-        next_cursor = pagination.get("next_starting_after")
-        if next_cursor:
-            result["_pagination_hint"] = f"MORE RESULTS AVAILABLE. Call list_campaigns with starting_after='{next_cursor}' to get next page."
-    
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def get_campaign(params: GetCampaignInput) -> str:
@@ -357,7 +361,7 @@ async def get_campaign(params: GetCampaignInput) -> str:
     """
     client = get_client()
     result = await client.get(f"/campaigns/{params.campaign_id}")
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def update_campaign(params: UpdateCampaignInput) -> str:
@@ -376,62 +380,11 @@ async def update_campaign(params: UpdateCampaignInput) -> str:
     """
     client = get_client()
     
-    body = {}
-    
-    # Add all optional fields if provided
-    if params.name is not None:
-        body["name"] = params.name
-    if params.pl_value is not None:
-        body["pl_value"] = params.pl_value
-    if params.is_evergreen is not None:
-        body["is_evergreen"] = params.is_evergreen
-    if params.campaign_schedule is not None:
-        body["campaign_schedule"] = params.campaign_schedule
-    if params.sequences is not None:
-        body["sequences"] = params.sequences
-    if params.email_gap is not None:
-        body["email_gap"] = params.email_gap
-    if params.random_wait_max is not None:
-        body["random_wait_max"] = params.random_wait_max
-    if params.text_only is not None:
-        body["text_only"] = params.text_only
-    if params.email_list is not None:
-        body["email_list"] = params.email_list
-    if params.daily_limit is not None:
-        body["daily_limit"] = params.daily_limit
-    if params.stop_on_reply is not None:
-        body["stop_on_reply"] = params.stop_on_reply
-    if params.email_tag_list is not None:
-        body["email_tag_list"] = params.email_tag_list
-    if params.link_tracking is not None:
-        body["link_tracking"] = params.link_tracking
-    if params.open_tracking is not None:
-        body["open_tracking"] = params.open_tracking
-    if params.stop_on_auto_reply is not None:
-        body["stop_on_auto_reply"] = params.stop_on_auto_reply
-    if params.daily_max_leads is not None:
-        body["daily_max_leads"] = params.daily_max_leads
-    if params.prioritize_new_leads is not None:
-        body["prioritize_new_leads"] = params.prioritize_new_leads
-    if params.auto_variant_select is not None:
-        body["auto_variant_select"] = params.auto_variant_select
-    if params.match_lead_esp is not None:
-        body["match_lead_esp"] = params.match_lead_esp
-    if params.stop_for_company is not None:
-        body["stop_for_company"] = params.stop_for_company
-    if params.insert_unsubscribe_header is not None:
-        body["insert_unsubscribe_header"] = params.insert_unsubscribe_header
-    if params.allow_risky_contacts is not None:
-        body["allow_risky_contacts"] = params.allow_risky_contacts
-    if params.disable_bounce_protect is not None:
-        body["disable_bounce_protect"] = params.disable_bounce_protect
-    if params.cc_list is not None:
-        body["cc_list"] = params.cc_list
-    if params.bcc_list is not None:
-        body["bcc_list"] = params.bcc_list
+    # Partial update: only fields the caller set are sent
+    body = params.model_dump(exclude={"campaign_id"}, exclude_none=True)
     
     result = await client.patch(f"/campaigns/{params.campaign_id}", json=body)
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def activate_campaign(params: ActivateCampaignInput) -> str:
@@ -448,7 +401,7 @@ async def activate_campaign(params: ActivateCampaignInput) -> str:
     """
     client = get_client()
     result = await client.post(f"/campaigns/{params.campaign_id}/activate")
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def pause_campaign(params: PauseCampaignInput) -> str:
@@ -464,7 +417,7 @@ async def pause_campaign(params: PauseCampaignInput) -> str:
     """
     client = get_client()
     result = await client.post(f"/campaigns/{params.campaign_id}/pause")
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def delete_campaign(params: DeleteCampaignInput) -> str:
@@ -486,12 +439,12 @@ async def delete_campaign(params: DeleteCampaignInput) -> str:
     """
     client = get_client()
     result = await client.delete(f"/campaigns/{params.campaign_id}")
-    return json.dumps({
+    return _json.dumps({
         "success": True,
         "deleted_campaign_id": params.campaign_id,
         "message": "Campaign permanently deleted",
         **result
-    }, indent=2)
+    })
 
 
 async def search_campaigns_by_contact(params: SearchCampaignsByContactInput) -> str:
@@ -510,7 +463,7 @@ async def search_campaigns_by_contact(params: SearchCampaignsByContactInput) ->
     query_params = {"contact_email": params.contact_email}
 
     result = await client.get("/campaigns/search-by-contact", params=query_params)
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 # Export all campaign tools
@@ -1,24 +1,91 @@
 """
 Instantly MCP Server - Email Tools
 
-5 tools for email management operations.
+7 tools for email management operations.
 """
 
 import asyncio
-import json
+import random
 import time
+from collections import OrderedDict
 from typing import Any, Optional
-from urllib.parse import quote
 
-from ..client import get_client
+import httpx
+
+from .. import _json
+from .._fields import set_fields
+from .._urls import quote_email
+from ..client import InstantlyClient, get_client
 from ..models.emails import (
     ListEmailsInput,
     GetEmailInput,
+    GetEmailsBulkInput,
     ReplyToEmailInput,
     VerifyEmailInput,
     MarkThreadAsReadInput,
 )
 
+# Query parameters forwarded by list_emails, in API order
+_LIST_EMAILS_FIELDS = (
+    "limit",
+    "starting_after",
+    "search",
+    "campaign_id",
+    "i_status",
+    "eaccount",
+    "is_unread",
+    "has_reminder",
+    "mode",
+    "preview_only",
+    "sort_order",
+    "scheduled_only",
+    "assigned_to",
+    "lead",
+    "company_domain",
+    "marked_as_done",
+    "email_type",
+)
+
+# Query for the common no-filters call (shared, never mutated)
+_DEFAULT_EMAILS_QUERY = {"limit": 100}
+
+# Upper bound (seconds) for the backed-off verification poll interval
+MAX_POLL_INTERVAL = 5.0
+
+# (api key, email) -> in-flight verification request / poller
+_verification_requests: dict[tuple[str, str], asyncio.Future] = {}
+_verification_pollers: dict[tuple[str, str], asyncio.Future] = {}
+
+# Final verdicts (verified/invalid) are reused for VERDICT_TTL seconds so
+# re-verifying the same recipient doesn't spend another credit
+VERDICT_TTL = 600.0
+MAX_CACHED_VERDICTS = 1024
+
+# (api key, email) -> (expires_at, raw verification result)
+_verdicts: OrderedDict[tuple[str, str], tuple[float, bytes]] = OrderedDict()
+
+
+def _cached_verdict(key: tuple[str, str]) -> Optional[dict[str, Any]]:
+    """Return a still-fresh final verdict, or None."""
+    entry = _verdicts.get(key)
+    if entry is None:
+        return None
+    expires_at, body = entry
+    if expires_at <= time.monotonic():
+        del _verdicts[key]
+        return None
+    _verdicts.move_to_end(key)
+    return _json.loads(body)
+
+
+def _store_verdict(key: tuple[str, str], result: dict[str, Any]) -> None:
+    """Remember a final verdict for VERDICT_TTL seconds."""
+    verdict = {k: v for k, v in result.items() if k != "_polling_info"}
+    _verdicts[key] = (time.monotonic() + VERDICT_TTL, _json.dumps_bytes(verdict))
+    _verdicts.move_to_end(key)
+    while len(_verdicts) > MAX_CACHED_VERDICTS:
+        _verdicts.popitem(last=False)
+
 
 async def list_emails(params: Optional[ListEmailsInput] = None) -> str:
     """
@@ -39,61 +106,17 @@ async def list_emails(params: Optional[ListEmailsInput] = None) -> str:
     """
     client = get_client()
     
-    # Handle case where params is None (for OpenAI/non-Claude clients)
-    # Set default limit=100 to return more results by default
-    if params is None:
-        params = ListEmailsInput(limit=100)
-    
-    query_params: dict[str, Any] = {}
-    
-    if params.limit:
-        query_params["limit"] = params.limit
+    # No params (OpenAI/non-Claude clients) or nothing set: default 100 results
+    if params is None or not params.model_fields_set:
+        query_params = _DEFAULT_EMAILS_QUERY
     else:
-        # Default to 100 results if no limit specified
-        query_params["limit"] = 100
-    if params.starting_after:
-        query_params["starting_after"] = params.starting_after
-    if params.search:
-        query_params["search"] = params.search
-    if params.campaign_id:
-        query_params["campaign_id"] = params.campaign_id
-    if params.i_status is not None:
-        query_params["i_status"] = params.i_status
-    if params.eaccount:
-        query_params["eaccount"] = params.eaccount
-    if params.is_unread is not None:
-        query_params["is_unread"] = params.is_unread
-    if params.has_reminder is not None:
-        query_params["has_reminder"] = params.has_reminder
-    if params.mode:
-        query_params["mode"] = params.mode
-    if params.preview_only is not None:
-        query_params["preview_only"] = params.preview_only
-    if params.sort_order:
-        query_params["sort_order"] = params.sort_order
-    if params.scheduled_only is not None:
-        query_params["scheduled_only"] = params.scheduled_only
-    if params.assigned_to:
-        query_params["assigned_to"] = params.assigned_to
-    if params.lead:
-        query_params["lead"] = params.lead
-    if params.company_domain:
-        query_params["company_domain"] = params.company_domain
-    if params.marked_as_done is not None:
-        query_params["marked_as_done"] = params.marked_as_done
-    if params.email_type:
-        query_params["email_type"] = params.email_type
+        # Unset and blank filters are omitted; limit defaults to 100
+        query_params = set_fields(params, _LIST_EMAILS_FIELDS)
+        query_params.setdefault("limit", 100)
     
     result = await client.get("/emails", params=query_params)
     
-    # Add pagination guidance for LLMs
-    if isinstance(result, dict):
-        pagination = result.get("pagination", {})
-        next_cursor = pagination.get("next_starting_after")
-        if next_cursor:
-            result["_pagination_hint"] = f"MORE RESULTS AVAILABLE. Call list_emails with starting_after='{next_cursor}' to get next page."
-    
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def get_email(params: GetEmailInput) -> str:
@@ -109,7 +132,29 @@ async def get_email(params: GetEmailInput) -> str:
     """
     client = get_client()
     result = await client.get(f"/emails/{params.email_id}")
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
+
+
+async def get_emails_bulk(params: GetEmailsBulkInput) -> str:
+    """
+    Get details for up to 50 emails in one call (e.g. every email in a thread).
+    
+    Emails are fetched concurrently. Results keep the order of email_ids;
+    an email that could not be fetched appears as {"email_id", "error"}
+    instead of failing the whole call.
+    """
+    client = get_client()
+    results = await client.gather(
+        *(("GET", f"/emails/{email_id}", None) for email_id in params.email_ids),
+        return_exceptions=True,
+    )
+    
+    emails = [
+        {"email_id": email_id, "error": str(result)}
+        if isinstance(result, Exception) else result
+        for email_id, result in zip(params.email_ids, results)
+    ]
+    return _json.dumps({"items": emails, "count": len(emails)})
 
 
 async def reply_to_email(params: ReplyToEmailInput) -> str:
@@ -127,15 +172,9 @@ async def reply_to_email(params: ReplyToEmailInput) -> str:
     """
     client = get_client()
     
-    body: dict[str, Any] = {
-        "reply_to_uuid": params.reply_to_uuid,
-        "eaccount": params.eaccount,
-        "subject": params.subject,
-        "body": params.body.model_dump(exclude_none=True),
-    }
-    
-    result = await client.post("/emails/reply", json=body)
-    return json.dumps(result, indent=2)
+    # Field names match the API, so pydantic-core serializes the body in one pass
+    result = await client.post("/emails/reply", content=params.to_api_json())
+    return _json.dumps(result)
 
 
 async def count_unread_emails() -> str:
@@ -147,7 +186,66 @@ async def count_unread_emails() -> str:
     """
     client = get_client()
     result = await client.get("/emails/unread/count")
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
+
+
+async def _poll_verification(
+    client: InstantlyClient, email: str, poll_interval: float, max_wait: float
+) -> tuple[Optional[dict[str, Any]], dict[str, Any]]:
+    """
+    Poll a pending verification until it resolves or max_wait elapses.
+
+    Returns (final_result, polling_info); final_result is None on timeout.
+    """
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    deadline = start_time + max_wait
+    poll_count = 0
+    email_encoded = quote_email(email)
+    # Back off between polls (with jitter) so long verifications don't
+    # hammer the API at a fixed rate
+    interval = poll_interval
+    backoff_schedule: list[float] = []
+
+    while (remaining := deadline - loop.time()) > 0:
+        # Wait before polling, never sleeping past the deadline
+        delay = min(interval, remaining)
+        await asyncio.sleep(delay)
+        backoff_schedule.append(round(delay, 2))
+        poll_count += 1
+        interval = min(MAX_POLL_INTERVAL, interval * 1.5) + random.uniform(0, 0.25)
+
+        try:
+            # GET endpoint to check verification status
+            poll_result = await client.get(f"/email-verification/{email_encoded}")
+            verification_status = poll_result.get("verification_status", "")
+
+            if verification_status in ("verified", "invalid"):
+                # Final result received
+                return poll_result, {
+                    "polls_made": poll_count,
+                    "total_time_seconds": round(loop.time() - start_time, 2),
+                    "final_status": verification_status,
+                    "backoff_schedule": backoff_schedule,
+                }
+
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if status == 429:
+                # Still rate limited after the client's own retries: slow right down
+                interval = max(interval, MAX_POLL_INTERVAL)
+            elif status < 500:
+                # Client errors won't resolve by polling again
+                return None, {
+                    "polls_made": poll_count,
+                    "backoff_schedule": backoff_schedule,
+                    "poll_error": str(e),
+                }
+        except Exception:
+            # Transient failures (timeouts, connection errors): keep trying until timeout
+            pass
+
+    return None, {"polls_made": poll_count, "backoff_schedule": backoff_schedule}
 
 
 async def verify_email(params: VerifyEmailInput) -> str:
@@ -157,13 +255,17 @@ async def verify_email(params: VerifyEmailInput) -> str:
     Initiates a new email verification via POST request.
     If verification takes longer than 10 seconds, the initial response will have
     verification_status='pending'. The tool will automatically poll for the final
-    result unless skip_polling=true.
+    result unless skip_polling=true. Concurrent calls for the same address share
+    one verification request and poller, and a final verdict is reused for 10 minutes (marked
+    _cached: true) unless the response cache is disabled (read_only reuses but never stores).
 
     Parameters:
     - email: The email address to verify (required)
     - max_wait_seconds: Maximum time to wait for verification (0-120, default: 45)
-    - poll_interval_seconds: Time between polling attempts (1-10, default: 2)
+    - poll_interval_seconds: Initial time between polling attempts (1-10, default: 2);
+      grows 1.5x per poll (plus jitter) up to 5 seconds
     - skip_polling: Return immediately even if status is pending (default: false)
+    - skip_cache: Re-verify even if a recent verdict is cached (default: false)
 
     Returns:
     - verification_status: pending, verified, invalid
@@ -174,10 +276,24 @@ async def verify_email(params: VerifyEmailInput) -> str:
     - _polling_info: (added) Information about polling if it occurred
     """
     client = get_client()
-
-    # Use POST to initiate verification (per v2 API spec)
-    body = {"email": params.email}
-    result = await client.post("/email-verification", json=body)
+    key = (client.resolve_api_key() or "", params.email.lower())
+    # Verdicts follow the response cache policy: read_only serves, never stores
+    use_verdicts = client.cache.enabled
+    store_verdicts = client.cache.policy not in ("read_only", "disabled")
+
+    if use_verdicts and not params.skip_cache and (cached := _cached_verdict(key)) is not None:
+        cached["_cached"] = True
+        return _json.dumps(cached)
+
+    # Use POST to initiate verification (per v2 API spec); concurrent calls
+    # for the same address share one request (each verification costs a credit)
+    request = _verification_requests.get(key)
+    if request is None:
+        body = {"email": params.email}
+        request = asyncio.ensure_future(client.post("/email-verification", json=body))
+        _verification_requests[key] = request
+        request.add_done_callback(lambda _: _verification_requests.pop(key, None))
+    result = dict(await asyncio.shield(request))
 
     # Get polling parameters with defaults
     max_wait = params.max_wait_seconds if params.max_wait_seconds is not None else 45
@@ -188,43 +304,74 @@ async def verify_email(params: VerifyEmailInput) -> str:
     verification_status = result.get("verification_status", "")
 
     if verification_status == "pending" and not skip_polling and max_wait > 0:
-        # Poll for the final result
-        start_time = time.time()
-        poll_count = 0
-        email_encoded = quote(params.email, safe="")
-
-        while time.time() - start_time < max_wait:
-            # Wait before polling
-            await asyncio.sleep(poll_interval)
-            poll_count += 1
+        # Concurrent verifies of the same address (per tenant) share one poller.
+        # A shared poller may stop before our own budget runs out (it was
+        # started with another caller's max_wait), so keep polling until
+        # our deadline.
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        deadline = start_time + max_wait
+        final_result: Optional[dict[str, Any]] = None
+        polls_made = 0
+        backoff_schedule: list[float] = []
+        poll_error: Optional[str] = None
+
+        while (remaining := deadline - loop.time()) > 0:
+            poller = _verification_pollers.get(key)
+            wait_limit: Optional[float] = remaining
+            if poller is None:
+                poller = asyncio.ensure_future(
+                    _poll_verification(client, params.email, poll_interval, remaining)
+                )
+                _verification_pollers[key] = poller
+                poller.add_done_callback(lambda _: _verification_pollers.pop(key, None))
+                # Our own poller is already bounded by the remaining time
+                wait_limit = None
 
             try:
-                # GET endpoint to check verification status
-                poll_result = await client.get(f"/email-verification/{email_encoded}")
-                verification_status = poll_result.get("verification_status", "")
-
-                if verification_status in ("verified", "invalid"):
-                    # Final result received
-                    poll_result["_polling_info"] = {
-                        "polls_made": poll_count,
-                        "total_time_seconds": round(time.time() - start_time, 2),
-                        "final_status": verification_status
-                    }
-                    return json.dumps(poll_result, indent=2)
-
-            except Exception as e:
-                # If polling fails, continue trying until timeout
-                pass
-
-        # Timeout reached while still pending
+                final_result, polling_info = await asyncio.wait_for(
+                    asyncio.shield(poller), timeout=wait_limit
+                )
+            except asyncio.TimeoutError:
+                break
+
+            polls_made += polling_info.get("polls_made", 0)
+            backoff_schedule.extend(polling_info.get("backoff_schedule", ()))
+            poll_error = polling_info.get("poll_error")
+            if final_result is not None or poll_error is not None:
+                break
+
+        waited = round(loop.time() - start_time, 2)
+        if final_result is not None:
+            if store_verdicts:
+                _store_verdict(key, final_result)
+            final_result = {
+                **final_result,
+                "_polling_info": {
+                    "polls_made": polls_made,
+                    "total_time_seconds": waited,
+                    "final_status": final_result.get("verification_status"),
+                    "backoff_schedule": backoff_schedule,
+                },
+            }
+            return _json.dumps(final_result)
+
         result["_polling_info"] = {
-            "polls_made": poll_count,
-            "total_time_seconds": round(time.time() - start_time, 2),
-            "timeout_reached": True,
-            "note": f"Verification still pending after {max_wait}s. Check status later with GET /email-verification/{params.email}"
+            "polls_made": polls_made,
+            "total_time_seconds": waited,
+            "backoff_schedule": backoff_schedule,
         }
+        if poll_error is not None:
+            # Polling hit an error that retrying won't fix
+            result["_polling_info"]["poll_error"] = poll_error
+        else:
+            # Timeout reached while still pending
+            result["_polling_info"]["timeout_reached"] = True
+            result["_polling_info"]["note"] = f"Verification still pending after {waited}s. Check status later with GET /email-verification/{params.email}"
+    elif store_verdicts and verification_status in ("verified", "invalid"):
+        _store_verdict(key, result)
 
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def mark_thread_as_read(params: MarkThreadAsReadInput) -> str:
@@ -241,18 +388,19 @@ async def mark_thread_as_read(params: MarkThreadAsReadInput) -> str:
     """
     client = get_client()
     result = await client.post(f"/emails/threads/{params.thread_id}/mark-as-read")
-    return json.dumps({
+    return _json.dumps({
         "success": True,
         "thread_id": params.thread_id,
         "message": "Thread marked as read",
         **result
-    }, indent=2)
+    })
 
 
 # Export all email tools
 EMAIL_TOOLS = [
     list_emails,
     get_email,
+    get_emails_bulk,
     reply_to_email,
     count_unread_emails,
     verify_email,
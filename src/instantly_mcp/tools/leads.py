@@ -1,17 +1,19 @@
 """
 Instantly MCP Server - Lead Tools
 
-11 tools for lead and lead list management operations.
+13 tools for lead and lead list management operations.
 The most comprehensive tool category with bulk operations and custom variables.
 """
 
-import json
-from typing import Any, Optional
+from typing import Optional
 
+from .. import _json
+from .._fields import set_fields
 from ..client import get_client
 from ..models.leads import (
     ListLeadsInput,
     GetLeadInput,
+    GetLeadsBulkInput,
     CreateLeadInput,
     UpdateLeadInput,
     ListLeadListsInput,
@@ -24,6 +26,27 @@ from ..models.leads import (
     MoveLeadsInput,
 )
 
+# Optional request fields forwarded by each tool, in API order (required
+# fields such as email and name are always sent, even when blank)
+_LIST_LEADS_FIELDS = (
+    "campaign", "list_id", "list_ids", "status", "created_after",
+    "created_before", "search", "filter", "distinct_contacts", "starting_after",
+)
+_CREATE_LEAD_FIELDS = (
+    "campaign", "first_name", "last_name", "company_name", "phone",
+    "website", "personalization", "lt_interest_status", "pl_value_lead",
+    "list_id", "assigned_to", "skip_if_in_workspace", "skip_if_in_campaign",
+    "skip_if_in_list", "blocklist_id", "verify_leads_on_import", "custom_variables",
+)
+_LIST_LEAD_LISTS_FIELDS = ("limit", "starting_after", "has_enrichment_task", "search")
+_CREATE_LEAD_LIST_FIELDS = ("has_enrichment_task", "owned_by")
+_MOVE_LEADS_FIELDS = (
+    "to_campaign_id", "to_list_id", "ids", "search", "filter", "campaign",
+    "list_id", "in_campaign", "in_list", "queries", "excluded_ids", "contacts",
+    "check_duplicates_in_campaigns", "skip_leads_in_verification", "limit",
+    "assigned_to", "esp_code", "esg_code", "copy_leads", "check_duplicates",
+)
+
 
 async def list_leads(params: Optional[ListLeadsInput] = None) -> str:
     """
@@ -48,43 +71,12 @@ async def list_leads(params: Optional[ListLeadsInput] = None) -> str:
     if params is None:
         params = ListLeadsInput(limit=100)
     
-    # Build request body for POST /leads/list
-    body: dict[str, Any] = {}
-    
-    # Default to 100 results if no limit specified
-    body["limit"] = params.limit or 100
-    
-    if params.campaign:
-        body["campaign"] = params.campaign
-    if params.list_id:
-        body["list_id"] = params.list_id
-    if params.list_ids:
-        body["list_ids"] = params.list_ids
-    if params.status:
-        body["status"] = params.status
-    if params.created_after:
-        body["created_after"] = params.created_after
-    if params.created_before:
-        body["created_before"] = params.created_before
-    if params.search:
-        body["search"] = params.search
-    if params.filter:
-        body["filter"] = params.filter
-    if params.distinct_contacts is not None:
-        body["distinct_contacts"] = params.distinct_contacts
-    if params.starting_after:
-        body["starting_after"] = params.starting_after
-    
-    result = await client.post("/leads/list", json=body)
-    
-    # Add pagination guidance for LLMs
-    if isinstance(result, dict):
-        pagination = result.get("pagination", {})
-        next_cursor = pagination.get("next_starting_after")
-        if next_cursor:
-            result["_pagination_hint"] = f"MORE RESULTS AVAILABLE. Call list_leads with starting_after='{next_cursor}' to get next page."
-    
-    return json.dumps(result, indent=2)
+    # Build request body for POST /leads/list (limit defaults to 100)
+    body = {"limit": params.limit or 100, **set_fields(params, _LIST_LEADS_FIELDS)}
+    
+    result = await client.post("/leads/list", json=body, read_only=True)
+    
+    return _json.dumps(result)
 
 
 async def get_lead(params: GetLeadInput) -> str:
@@ -100,7 +92,20 @@ async def get_lead(params: GetLeadInput) -> str:
     """
     client = get_client()
     result = await client.get(f"/leads/{params.lead_id}")
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
+
+
+async def get_leads_bulk(params: GetLeadsBulkInput) -> str:
+    """
+    Get details for up to 100 leads by ID in a single request.
+    
+    Prefer this over repeated get_lead calls. Leads that don't exist are
+    simply absent from items.
+    """
+    client = get_client()
+    body = {"ids": params.lead_ids, "limit": len(params.lead_ids)}
+    result = await client.post("/leads/list", json=body, read_only=True)
+    return _json.dumps(result)
 
 
 async def create_lead(params: CreateLeadInput) -> str:
@@ -116,47 +121,10 @@ async def create_lead(params: CreateLeadInput) -> str:
     """
     client = get_client()
     
-    body: dict[str, Any] = {
-        "email": params.email,
-    }
-    
-    if params.campaign:
-        body["campaign"] = params.campaign
-    if params.first_name:
-        body["first_name"] = params.first_name
-    if params.last_name:
-        body["last_name"] = params.last_name
-    if params.company_name:
-        body["company_name"] = params.company_name
-    if params.phone:
-        body["phone"] = params.phone
-    if params.website:
-        body["website"] = params.website
-    if params.personalization:
-        body["personalization"] = params.personalization
-    if params.lt_interest_status is not None:
-        body["lt_interest_status"] = params.lt_interest_status
-    if params.pl_value_lead:
-        body["pl_value_lead"] = params.pl_value_lead
-    if params.list_id:
-        body["list_id"] = params.list_id
-    if params.assigned_to:
-        body["assigned_to"] = params.assigned_to
-    if params.skip_if_in_workspace is not None:
-        body["skip_if_in_workspace"] = params.skip_if_in_workspace
-    if params.skip_if_in_campaign is not None:
-        body["skip_if_in_campaign"] = params.skip_if_in_campaign
-    if params.skip_if_in_list is not None:
-        body["skip_if_in_list"] = params.skip_if_in_list
-    if params.blocklist_id:
-        body["blocklist_id"] = params.blocklist_id
-    if params.verify_leads_on_import is not None:
-        body["verify_leads_on_import"] = params.verify_leads_on_import
-    if params.custom_variables:
-        body["custom_variables"] = params.custom_variables
+    body = {"email": params.email, **set_fields(params, _CREATE_LEAD_FIELDS)}
     
     result = await client.post("/leads", json=body)
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def update_lead(params: UpdateLeadInput) -> str:
@@ -174,31 +142,10 @@ async def update_lead(params: UpdateLeadInput) -> str:
     """
     client = get_client()
     
-    body: dict[str, Any] = {}
-    
-    if params.personalization is not None:
-        body["personalization"] = params.personalization
-    if params.website is not None:
-        body["website"] = params.website
-    if params.last_name is not None:
-        body["last_name"] = params.last_name
-    if params.first_name is not None:
-        body["first_name"] = params.first_name
-    if params.company_name is not None:
-        body["company_name"] = params.company_name
-    if params.phone is not None:
-        body["phone"] = params.phone
-    if params.lt_interest_status is not None:
-        body["lt_interest_status"] = params.lt_interest_status
-    if params.pl_value_lead is not None:
-        body["pl_value_lead"] = params.pl_value_lead
-    if params.assigned_to is not None:
-        body["assigned_to"] = params.assigned_to
-    if params.custom_variables is not None:
-        body["custom_variables"] = params.custom_variables
+    body = params.model_dump(exclude={"lead_id"}, exclude_none=True)
     
     result = await client.patch(f"/leads/{params.lead_id}", json=body)
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def list_lead_lists(params: Optional[ListLeadListsInput] = None) -> str:
@@ -219,29 +166,13 @@ async def list_lead_lists(params: Optional[ListLeadListsInput] = None) -> str:
     if params is None:
         params = ListLeadListsInput(limit=100)
     
-    query_params = {}
-    if params.limit:
-        query_params["limit"] = params.limit
-    else:
-        # Default to 100 results if no limit specified
-        query_params["limit"] = 100
-    if params.starting_after:
-        query_params["starting_after"] = params.starting_after
-    if params.has_enrichment_task is not None:
-        query_params["has_enrichment_task"] = params.has_enrichment_task
-    if params.search:
-        query_params["search"] = params.search
+    # Unset and blank filters are omitted; limit defaults to 100
+    query_params = set_fields(params, _LIST_LEAD_LISTS_FIELDS)
+    query_params.setdefault("limit", 100)
     
     result = await client.get("/lead-lists", params=query_params)
     
-    # Add pagination guidance for LLMs
-    if isinstance(result, dict):
-        pagination = result.get("pagination", {})
-        next_cursor = pagination.get("next_starting_after")
-        if next_cursor:
-            result["_pagination_hint"] = f"MORE RESULTS AVAILABLE. Call list_lead_lists with starting_after='{next_cursor}' to get next page."
-    
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def create_lead_list(params: CreateLeadListInput) -> str:
@@ -253,17 +184,10 @@ async def create_lead_list(params: CreateLeadListInput) -> str:
     """
     client = get_client()
     
-    body: dict[str, Any] = {
-        "name": params.name,
-    }
-    
-    if params.has_enrichment_task is not None:
-        body["has_enrichment_task"] = params.has_enrichment_task
-    if params.owned_by:
-        body["owned_by"] = params.owned_by
+    body = {"name": params.name, **set_fields(params, _CREATE_LEAD_LIST_FIELDS)}
     
     result = await client.post("/lead-lists", json=body)
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def update_lead_list(params: UpdateLeadListInput) -> str:
@@ -272,17 +196,10 @@ async def update_lead_list(params: UpdateLeadListInput) -> str:
     """
     client = get_client()
     
-    body: dict[str, Any] = {}
-    
-    if params.name is not None:
-        body["name"] = params.name
-    if params.has_enrichment_task is not None:
-        body["has_enrichment_task"] = params.has_enrichment_task
-    if params.owned_by is not None:
-        body["owned_by"] = params.owned_by
+    body = params.model_dump(exclude={"list_id"}, exclude_none=True)
     
     result = await client.patch(f"/lead-lists/{params.list_id}", json=body)
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def get_verification_stats_for_lead_list(params: GetVerificationStatsInput) -> str:
@@ -297,7 +214,7 @@ async def get_verification_stats_for_lead_list(params: GetVerificationStatsInput
     """
     client = get_client()
     result = await client.get(f"/lead-lists/{params.list_id}/verification-stats")
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def add_leads_to_campaign_or_list_bulk(params: BulkAddLeadsInput) -> str:
@@ -313,29 +230,9 @@ async def add_leads_to_campaign_or_list_bulk(params: BulkAddLeadsInput) -> str:
     """
     client = get_client()
     
-    body: dict[str, Any] = {
-        "leads": [lead.model_dump(exclude_none=True) for lead in params.leads],
-    }
-    
-    if params.campaign_id:
-        body["campaign_id"] = params.campaign_id
-    if params.list_id:
-        body["list_id"] = params.list_id
-    if params.blocklist_id:
-        body["blocklist_id"] = params.blocklist_id
-    if params.assigned_to:
-        body["assigned_to"] = params.assigned_to
-    if params.verify_leads_on_import is not None:
-        body["verify_leads_on_import"] = params.verify_leads_on_import
-    if params.skip_if_in_workspace is not None:
-        body["skip_if_in_workspace"] = params.skip_if_in_workspace
-    if params.skip_if_in_campaign is not None:
-        body["skip_if_in_campaign"] = params.skip_if_in_campaign
-    if params.skip_if_in_list is not None:
-        body["skip_if_in_list"] = params.skip_if_in_list
-    
-    result = await client.post("/leads/add", json=body)
-    return json.dumps(result, indent=2)
+    # Field names match the API, so pydantic-core serializes the body in one pass
+    result = await client.post("/leads/add", content=params.to_api_json())
+    return _json.dumps(result)
 
 
 async def delete_lead(params: DeleteLeadInput) -> str:
@@ -351,7 +248,7 @@ async def delete_lead(params: DeleteLeadInput) -> str:
     """
     client = get_client()
     result = await client.delete(f"/leads/{params.lead_id}")
-    return json.dumps({"success": True, "deleted": params.lead_id, **result}, indent=2)
+    return _json.dumps({"success": True, "deleted": params.lead_id, **result})
 
 
 async def move_leads_to_campaign_or_list(params: MoveLeadsInput) -> str:
@@ -370,54 +267,16 @@ async def move_leads_to_campaign_or_list(params: MoveLeadsInput) -> str:
     - to_list_id: Target list
 
     Set copy_leads=true to copy instead of move.
+
+    Returns the background job immediately; check its progress with
+    get_background_job(job_id=<returned id>) instead of waiting here.
     """
     client = get_client()
 
-    body: dict[str, Any] = {}
-
-    if params.to_campaign_id:
-        body["to_campaign_id"] = params.to_campaign_id
-    if params.to_list_id:
-        body["to_list_id"] = params.to_list_id
-    if params.ids:
-        body["ids"] = params.ids
-    if params.search:
-        body["search"] = params.search
-    if params.filter:
-        body["filter"] = params.filter
-    if params.campaign:
-        body["campaign"] = params.campaign
-    if params.list_id:
-        body["list_id"] = params.list_id
-    if params.in_campaign is not None:
-        body["in_campaign"] = params.in_campaign
-    if params.in_list is not None:
-        body["in_list"] = params.in_list
-    if params.queries:
-        body["queries"] = params.queries
-    if params.excluded_ids:
-        body["excluded_ids"] = params.excluded_ids
-    if params.contacts:
-        body["contacts"] = params.contacts
-    if params.check_duplicates_in_campaigns is not None:
-        body["check_duplicates_in_campaigns"] = params.check_duplicates_in_campaigns
-    if params.skip_leads_in_verification is not None:
-        body["skip_leads_in_verification"] = params.skip_leads_in_verification
-    if params.limit is not None:
-        body["limit"] = params.limit
-    if params.assigned_to:
-        body["assigned_to"] = params.assigned_to
-    if params.esp_code is not None:
-        body["esp_code"] = params.esp_code
-    if params.esg_code is not None:
-        body["esg_code"] = params.esg_code
-    if params.copy_leads is not None:
-        body["copy_leads"] = params.copy_leads
-    if params.check_duplicates is not None:
-        body["check_duplicates"] = params.check_duplicates
+    body = set_fields(params, _MOVE_LEADS_FIELDS)
 
     result = await client.post("/leads/move", json=body)
-    return json.dumps(result, indent=2)
+    return _json.dumps(result)
 
 
 async def delete_lead_list(params: DeleteLeadListInput) -> str:
@@ -438,18 +297,19 @@ async def delete_lead_list(params: DeleteLeadListInput) -> str:
     """
     client = get_client()
     result = await client.delete(f"/lead-lists/{params.list_id}")
-    return json.dumps({
+    return _json.dumps({
         "success": True,
         "deleted_list_id": params.list_id,
         "message": "Lead list permanently deleted",
         **result
-    }, indent=2)
+    })
 
 
 # Export all lead tools
 LEAD_TOOLS = [
     list_leads,
     get_lead,
+    get_leads_bulk,
     create_lead,
     update_lead,
     list_lead_lists,
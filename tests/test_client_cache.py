@@ -0,0 +1,121 @@
+"""
+Response cache consistency tests for InstantlyClient.
+"""
+
+import asyncio
+
+import httpx
+
+from instantly_mcp.cache import ResponseCache
+from instantly_mcp.client import INSTANTLY_API_URL, InstantlyClient
+
+
+def _client(handler) -> InstantlyClient:
+    client = InstantlyClient(cache=ResponseCache(policy="enabled", ttl=30))
+    client.set_api_key("test-key")
+    client._http = httpx.AsyncClient(
+        base_url=INSTANTLY_API_URL,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+async def test_write_during_inflight_read_is_not_cached_over():
+    """A read that started before a write must not repopulate the cache."""
+    state = {"name": "old"}
+    read_started = asyncio.Event()
+    write_done = asyncio.Event()
+    first_read = True
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal first_read
+        if request.method == "PATCH":
+            state["name"] = "new"
+            return httpx.Response(200, json=state)
+        body = dict(state)
+        if first_read:
+            # Hold the first GET until the write has landed
+            first_read = False
+            read_started.set()
+            await write_done.wait()
+        return httpx.Response(200, json=body)
+
+    client = _client(handler)
+
+    async def write():
+        await read_started.wait()
+        await client.patch("/campaigns/x", json={"name": "new"})
+        write_done.set()
+
+    stale, _ = await asyncio.gather(client.get("/campaigns/x"), write())
+
+    assert stale == {"name": "old"}
+    assert await client.get("/campaigns/x") == {"name": "new"}
+    await client.aclose()
+
+
+async def test_reads_are_cached_without_writes():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={"id": "x"})
+
+    client = _client(handler)
+    assert await client.get("/campaigns/x") == {"id": "x"}
+    assert await client.get("/campaigns/x") == {"id": "x"}
+    assert calls == 1
+    await client.aclose()
+
+
+async def test_304_revalidates_expired_entry():
+    seen_etags = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_etags.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        headers = {"etag": '"v1"', "cache-control": "no-cache"}
+        return httpx.Response(200, json={"name": "old"}, headers=headers)
+
+    client = _client(handler)
+    assert await client.get("/campaigns/x") == {"name": "old"}
+    assert await client.get("/campaigns/x") == {"name": "old"}
+    assert seen_etags == [None, '"v1"']
+    await client.aclose()
+
+
+async def test_write_during_revalidation_refetches_full_body():
+    """A 304 for an entry a write invalidated mid-flight must not be trusted."""
+    state = {"name": "old", "etag": '"v1"'}
+    revalidating = asyncio.Event()
+    write_done = asyncio.Event()
+    seen_etags = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "PATCH":
+            state.update(name="new", etag='"v2"')
+            return httpx.Response(200, json={"name": "new"})
+        seen_etags.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            # Answer the conditional GET only after the write has landed
+            revalidating.set()
+            await write_done.wait()
+            return httpx.Response(304)
+        headers = {"etag": state["etag"], "cache-control": "no-cache"}
+        return httpx.Response(200, json={"name": state["name"]}, headers=headers)
+
+    client = _client(handler)
+    assert await client.get("/campaigns/x") == {"name": "old"}
+
+    async def write():
+        await revalidating.wait()
+        await client.patch("/campaigns/x", json={"name": "new"})
+        write_done.set()
+
+    result, _ = await asyncio.gather(client.get("/campaigns/x"), write())
+
+    assert result == {"name": "new"}
+    assert seen_etags == [None, '"v1"', None]
+    await client.aclose()
@@ -0,0 +1,148 @@
+"""
+Retry rules of InstantlyClient._send.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from instantly_mcp import client as client_module
+from instantly_mcp.cache import ResponseCache
+from instantly_mcp.client import INSTANTLY_API_URL, InstantlyClient
+
+
+def _client(handler) -> InstantlyClient:
+    client = InstantlyClient(cache=ResponseCache(policy="disabled"))
+    client.set_api_key("test-key")
+    client._http = httpx.AsyncClient(
+        base_url=INSTANTLY_API_URL,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+@pytest.fixture
+def delays(monkeypatch) -> list[float]:
+    """Record retry delays instead of sleeping through them."""
+    recorded: list[float] = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay, *args, **kwargs):
+        recorded.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def _replay(*outcomes):
+    """Handler that returns (or raises) each outcome in turn."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        outcome = outcomes[len(calls)]
+        calls.append(request.method)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return handler, calls
+
+
+@pytest.mark.parametrize("method", ["GET", "POST", "PATCH", "DELETE"])
+async def test_429_is_retried_for_every_method(method, delays):
+    handler, calls = _replay(httpx.Response(429), httpx.Response(200, json={"ok": True}))
+    client = _client(handler)
+
+    assert await client.request(method, "/campaigns/x") == {"ok": True}
+    assert len(calls) == 2
+    await client.aclose()
+
+
+@pytest.mark.parametrize("method", ["GET", "DELETE"])
+async def test_5xx_and_timeouts_are_retried_for_idempotent_methods(method, delays):
+    handler, calls = _replay(
+        httpx.Response(503),
+        httpx.ReadTimeout("slow"),
+        httpx.Response(200, json={"ok": True}),
+    )
+    client = _client(handler)
+
+    assert await client.request(method, "/campaigns/x") == {"ok": True}
+    assert len(calls) == 3
+    await client.aclose()
+
+
+@pytest.mark.parametrize("method", ["POST", "PATCH"])
+async def test_5xx_is_not_retried_for_writes(method, delays):
+    handler, calls = _replay(httpx.Response(503), httpx.Response(200, json={}))
+    client = _client(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.request(method, "/campaigns/x")
+    assert len(calls) == 1
+    await client.aclose()
+
+
+async def test_timeout_is_not_retried_for_writes(delays):
+    handler, calls = _replay(httpx.ReadTimeout("slow"), httpx.Response(200, json={}))
+    client = _client(handler)
+
+    with pytest.raises(TimeoutError):
+        await client.post("/campaigns")
+    assert len(calls) == 1
+    await client.aclose()
+
+
+async def test_retry_after_header_sets_delay(delays):
+    handler, _ = _replay(
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(200, json={}),
+    )
+    client = _client(handler)
+
+    await client.get("/campaigns")
+    assert delays == [7.0]
+    await client.aclose()
+
+
+async def test_ratelimit_reset_sets_delay_for_429(delays):
+    reset = int(time.time()) + 30
+    handler, _ = _replay(
+        httpx.Response(429, headers={"x-ratelimit-reset": str(reset)}),
+        httpx.Response(200, json={}),
+    )
+    client = _client(handler)
+
+    await client.get("/campaigns")
+    assert len(delays) == 1 and 28 <= delays[0] <= 30
+    await client.aclose()
+
+
+async def test_delete_404_after_timeout_retry_is_success(delays):
+    """The timed-out attempt may have deleted the resource already."""
+    handler, calls = _replay(httpx.ReadTimeout("slow"), httpx.Response(404))
+    client = _client(handler)
+
+    assert await client.delete("/campaigns/x") == {"success": True}
+    assert len(calls) == 2
+    await client.aclose()
+
+
+@pytest.mark.parametrize(
+    "outcomes",
+    [
+        (httpx.Response(404),),
+        (httpx.Response(429), httpx.Response(404)),
+        (httpx.ConnectError("refused"), httpx.Response(404)),
+    ],
+)
+async def test_delete_404_without_possibly_applied_attempt_fails(outcomes, delays):
+    handler, _ = _replay(*outcomes)
+    client = _client(handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.delete("/campaigns/x")
+    await client.aclose()
@@ -0,0 +1,57 @@
+"""
+Email tools against a mocked Instantly API.
+"""
+
+import asyncio
+import json
+import uuid
+
+import httpx
+
+from instantly_mcp.cache import ResponseCache
+from instantly_mcp.client import INSTANTLY_API_URL, MAX_CONCURRENT_REQUESTS, InstantlyClient
+from instantly_mcp.models.emails import GetEmailsBulkInput
+from instantly_mcp.tools import emails
+
+
+def _client(handler) -> InstantlyClient:
+    client = InstantlyClient(cache=ResponseCache(policy="disabled"))
+    client.set_api_key("test-key")
+    client._http = httpx.AsyncClient(
+        base_url=INSTANTLY_API_URL,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+async def test_get_emails_bulk_keeps_order_and_isolates_failures(monkeypatch):
+    email_ids = [str(uuid.uuid4()) for _ in range(25)]
+    missing = email_ids[7]
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        email_id = request.url.path.rsplit("/", 1)[-1]
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later IDs answer first, so completion order differs from request order
+        await asyncio.sleep(0.001 * (len(email_ids) - email_ids.index(email_id)))
+        in_flight -= 1
+        if email_id == missing:
+            return httpx.Response(404, json={"message": "Email not found"})
+        return httpx.Response(200, json={"id": email_id})
+
+    client = _client(handler)
+    monkeypatch.setattr(emails, "get_client", lambda: client)
+
+    result = json.loads(await emails.get_emails_bulk(GetEmailsBulkInput(email_ids=email_ids)))
+
+    assert result["count"] == len(email_ids)
+    for email_id, item in zip(email_ids, result["items"]):
+        if email_id == missing:
+            assert set(item) == {"email_id", "error"}
+            assert item["email_id"] == missing
+        else:
+            assert item == {"id": email_id}
+    assert peak == MAX_CONCURRENT_REQUESTS
+    await client.aclose()
@@ -0,0 +1,92 @@
+"""
+Lead tools against a mocked Instantly API.
+"""
+
+import json
+import uuid
+
+import httpx
+
+from instantly_mcp.cache import ResponseCache
+from instantly_mcp.client import INSTANTLY_API_URL, InstantlyClient
+from instantly_mcp.models.leads import (
+    CreateLeadInput,
+    CreateLeadListInput,
+    GetLeadsBulkInput,
+    ListLeadsInput,
+)
+from instantly_mcp.tools import leads
+
+
+def _client(handler) -> InstantlyClient:
+    client = InstantlyClient(cache=ResponseCache(policy="enabled", ttl=30))
+    client.set_api_key("test-key")
+    client._http = httpx.AsyncClient(
+        base_url=INSTANTLY_API_URL,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+async def test_list_leads_is_a_cached_read(monkeypatch):
+    """POST /leads/list only reads, so it is cached and keeps the cache."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        return httpx.Response(200, json={"items": [{"id": "l1"}]})
+
+    client = _client(handler)
+    monkeypatch.setattr(leads, "get_client", lambda: client)
+
+    await client.get("/campaigns/x")
+    first = await leads.list_leads(ListLeadsInput(campaign="c"))
+    second = await leads.list_leads(ListLeadsInput(campaign="c"))
+    await client.get("/campaigns/x")
+
+    assert json.loads(first) == json.loads(second) == {"items": [{"id": "l1"}]}
+    assert requests == [
+        ("GET", "/api/v2/campaigns/x"),
+        ("POST", "/api/v2/leads/list"),
+    ]
+    await client.aclose()
+
+
+async def test_create_bodies_always_carry_required_fields(monkeypatch):
+    """Blank required fields are sent for the API to reject, not dropped."""
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.url.path, json.loads(request.content)))
+        return httpx.Response(200, json={})
+
+    client = _client(handler)
+    monkeypatch.setattr(leads, "get_client", lambda: client)
+
+    await leads.create_lead(CreateLeadInput(email="  ", first_name=""))
+    await leads.create_lead_list(CreateLeadListInput(name=" ", owned_by="u"))
+
+    assert bodies == [
+        ("/api/v2/leads", {"email": ""}),
+        ("/api/v2/lead-lists", {"name": "", "owned_by": "u"}),
+    ]
+    await client.aclose()
+
+
+async def test_get_leads_bulk_posts_ids_and_is_cached(monkeypatch):
+    lead_ids = [str(uuid.uuid4()) for _ in range(3)]
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.url.path, json.loads(request.content)))
+        return httpx.Response(200, json={"items": [{"id": i} for i in lead_ids]})
+
+    client = _client(handler)
+    monkeypatch.setattr(leads, "get_client", lambda: client)
+
+    first = await leads.get_leads_bulk(GetLeadsBulkInput(lead_ids=lead_ids))
+    second = await leads.get_leads_bulk(GetLeadsBulkInput(lead_ids=lead_ids))
+
+    assert json.loads(first) == json.loads(second)
+    assert bodies == [("/api/v2/leads/list", {"ids": lead_ids, "limit": 3})]
+    await client.aclose()
@@ -0,0 +1,113 @@
+"""
+Shared-poller and verdict-cache behaviour of the verify_email tool.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from instantly_mcp.cache import ResponseCache
+from instantly_mcp.models.emails import VerifyEmailInput
+from instantly_mcp.tools import emails
+
+
+class FakeClient:
+    """Reports 'pending' until done_after seconds have passed."""
+
+    def __init__(self, done_after: float, policy: str = "disabled"):
+        self.done_at = asyncio.get_running_loop().time() + done_after
+        self.cache = ResponseCache(policy=policy)
+        self.posts = 0
+
+    def resolve_api_key(self):
+        return "test-key"
+
+    def _status(self):
+        if asyncio.get_running_loop().time() >= self.done_at:
+            return {"verification_status": "verified"}
+        return {"verification_status": "pending"}
+
+    async def post(self, endpoint, **kwargs):
+        self.posts += 1
+        return self._status()
+
+    async def get(self, endpoint, **kwargs):
+        return self._status()
+
+
+@pytest.fixture(autouse=True)
+def _no_cached_verdicts():
+    emails._verdicts.clear()
+    yield
+    emails._verdicts.clear()
+
+
+async def _verify(client, monkeypatch, **kwargs) -> dict:
+    monkeypatch.setattr(emails, "get_client", lambda: client)
+    return json.loads(await emails.verify_email(VerifyEmailInput(email="a@b.co", **kwargs)))
+
+
+async def test_joiner_keeps_polling_after_shorter_shared_poller(monkeypatch):
+    client = FakeClient(done_after=2.0)
+    monkeypatch.setattr(emails, "get_client", lambda: client)
+
+    short = emails.verify_email(
+        VerifyEmailInput(email="a@b.co", max_wait_seconds=1, poll_interval_seconds=1)
+    )
+    long = emails.verify_email(
+        VerifyEmailInput(email="a@b.co", max_wait_seconds=5, poll_interval_seconds=1)
+    )
+    short_result, long_result = map(json.loads, await asyncio.gather(short, long))
+
+    assert short_result["verification_status"] == "pending"
+    assert short_result["_polling_info"]["timeout_reached"] is True
+    assert long_result["verification_status"] == "verified"
+    assert long_result["_polling_info"]["total_time_seconds"] < 5
+
+
+async def test_final_verdict_is_reused(monkeypatch):
+    client = FakeClient(done_after=0, policy="enabled")
+
+    first = await _verify(client, monkeypatch)
+    second = await _verify(client, monkeypatch)
+
+    assert first["verification_status"] == second["verification_status"] == "verified"
+    assert "_cached" not in first
+    assert second["_cached"] is True
+    assert client.posts == 1
+
+
+async def test_skip_cache_reverifies(monkeypatch):
+    client = FakeClient(done_after=0, policy="enabled")
+
+    await _verify(client, monkeypatch)
+    result = await _verify(client, monkeypatch, skip_cache=True)
+
+    assert "_cached" not in result
+    assert client.posts == 2
+
+
+async def test_expired_verdict_is_not_reused(monkeypatch):
+    client = FakeClient(done_after=0, policy="enabled")
+    monkeypatch.setattr(emails, "VERDICT_TTL", 0)
+
+    await _verify(client, monkeypatch)
+    result = await _verify(client, monkeypatch)
+
+    assert "_cached" not in result
+    assert client.posts == 2
+
+
+async def test_read_only_policy_serves_but_never_stores(monkeypatch):
+    client = FakeClient(done_after=0, policy="read_only")
+
+    await _verify(client, monkeypatch)
+    assert not emails._verdicts
+    assert client.posts == 1
+
+    # A verdict stored earlier (e.g. before the policy changed) is still served
+    emails._store_verdict(("test-key", "a@b.co"), {"verification_status": "invalid"})
+    result = await _verify(client, monkeypatch)
+    assert result == {"verification_status": "invalid", "_cached": True}
+    assert client.posts == 1